@@ -1,15 +1,24 @@
 """This module contains some common functions for both folium and ipyleaflet."""
 
+import base64
+import codecs
+import copy
 import csv
+import functools
+import itertools
 import json
 import os
+import random
+import string
 import sys
 import requests
 import shutil
 import tarfile
-import urllib.request
+import tempfile
+import uuid
 import warnings
 import zipfile
+from datetime import date
 import folium
 import ipyleaflet
 import ipywidgets as widgets
@@ -23,13 +32,36 @@ from typing import Union, List, Dict, Optional, Tuple, TYPE_CHECKING, Any
 from .stac import *
 
 try:
-    from IPython.display import display
+    from IPython.display import HTML, IFrame, Javascript, display
 except ImportError:
     pass
 
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
 if TYPE_CHECKING:
     import geopandas as gpd
 
+# A shared HTTP session so that repeated downloads can reuse TCP/TLS connections.
+_SESSION = requests.Session()
+_SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=16))
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=16))
+
+# Buffer size used when copying downloaded or extracted data to disk. This is much
+# larger than the 8-64 KiB defaults of urllib/shutil and cuts the number of syscalls.
+_COPY_BUFSIZE = 1 << 20
+
+# Packages and executables found so far. Only positive results are cached because
+# a missing package or tool may still be installed later in the session.
+_FOUND_PACKAGES = set()
+_FOUND_TOOLS = set()
+
+
+# The whiteboxgui module, imported on the first call to whiteboxgui().
+_whiteboxgui_module = None
+
 
 class WhiteboxTools(whitebox.WhiteboxTools):
     """This class inherits the whitebox WhiteboxTools class."""
@@ -55,15 +87,17 @@ def whiteboxgui(
     Returns:
         object: A toolbox GUI.
     """
-    import whiteboxgui
+    global _whiteboxgui_module
 
-    return whiteboxgui.show(verbose, tree, reset, sandbox_path)
+    if _whiteboxgui_module is None:
+        import whiteboxgui as _whiteboxgui_module
 
+    return _whiteboxgui_module.show(verbose, tree, reset, sandbox_path)
 
+
+@functools.lru_cache(maxsize=None)
 def _in_colab_shell() -> bool:
     """Tests if the code is being executed within Google Colab."""
-    import sys
-
     if "google.colab" in sys.modules:
         return True
     else:
@@ -117,7 +151,6 @@ def _check_install(package: str) -> None:
     Args:
         package (str): The name of the package to check.
     """
-    import subprocess
 
     try:
         __import__(package)
@@ -125,7 +158,7 @@ def _check_install(package: str) -> None:
     except ImportError:
         print(f"{package} is not installed. Installing...")
         try:
-            subprocess.check_call(["python", "-m", "pip", "install", package])
+            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
         except subprocess.CalledProcessError as e:
             print(f"Failed to install {package}, Error: {e}")
             raise
@@ -146,10 +179,7 @@ def update_package() -> None:
 
     os.chdir(pkg_dir)
     try:
-        if shutil.which("pip"):
-            cmd = ["pip", "install", "."]
-        else:
-            cmd = ["pip3", "install", "."]
+        cmd = [sys.executable, "-m", "pip", "install", "."]
         subprocess.run(cmd, check=True)
     except subprocess.CalledProcessError as error:
         print(f"Failed to install the package: {error}")
@@ -163,12 +193,15 @@ def update_package() -> None:
 
 
 def check_package(name: str, URL: Optional[str] = "") -> None:
+    if name in _FOUND_PACKAGES:
+        return
     try:
         __import__(name.lower())
     except Exception:
         raise ImportError(
             f"{name} is not installed. Please install it before proceeding. {URL}"
         )
+    _FOUND_PACKAGES.add(name)
 
 
 def _clone_repo(out_dir: Optional[str] = ".", unzip: Optional[bool] = True) -> None:
@@ -203,8 +236,9 @@ def __install_from_github(url: str) -> None:
         if not os.path.exists(download_dir):
             os.makedirs(download_dir)
 
+        url = url.rstrip("/")
         repo_name = os.path.basename(url)
-        zip_url = os.path.join(url, "archive/master.zip")
+        zip_url = f"{url}/archive/master.zip"
         filename = repo_name + "-master.zip"
         download_from_url(
             url=zip_url, out_file_name=filename, out_dir=download_dir, unzip=True
@@ -215,9 +249,11 @@ def __install_from_github(url: str) -> None:
         work_dir = os.getcwd()
         os.chdir(pkg_dir)
         print("Installing {}...".format(pkg_name))
-        cmd = "pip install ."
-        os.system(cmd)
-        os.chdir(work_dir)
+        cmd = [sys.executable, "-m", "pip", "install", "."]
+        try:
+            subprocess.run(cmd, check=True)
+        finally:
+            os.chdir(work_dir)
         print("{} has been installed successfully.".format(pkg_name))
         # print("\nPlease comment out 'install_from_github()' and restart the kernel to take effect:\nJupyter menu -> Kernel -> Restart & Clear Output")
 
@@ -233,10 +269,7 @@ def _check_git_install() -> bool:
     """
     import webbrowser
 
-    cmd = "git --version"
-    output = os.popen(cmd).read()
-
-    if "git version" in output:
+    if shutil.which("git") is not None:
         return True
     else:
         url = "https://git-scm.com/downloads"
@@ -271,7 +304,7 @@ def _clone_github_repo(url: str, out_dir: str) -> None:
     out_file_path = os.path.join(parent_dir, repo_name + ".zip")
 
     try:
-        urllib.request.urlretrieve(url_zip, out_file_path)
+        _stream_download(url_zip, out_file_path)
     except Exception:
         print("The provided URL is invalid. Please double check the URL.")
         return
@@ -286,10 +319,15 @@ def _clone_github_repo(url: str, out_dir: str) -> None:
 
 def _is_tool(name: str) -> Optional[bool]:
     """Check whether `name` is on PATH and marked as executable."""
+    if name in _FOUND_TOOLS:
+        return True
     try:
-        return shutil.which(name) is not None
+        found = shutil.which(name) is not None
     except FileNotFoundError:
         return None
+    if found:
+        _FOUND_TOOLS.add(name)
+    return found
 
 
 def random_string(string_length: Optional[int] = 3) -> str:
@@ -301,12 +339,8 @@ def random_string(string_length: Optional[int] = 3) -> str:
     Returns:
         str: A random string
     """
-    import random
-    import string
-
     # random.seed(1001)
-    letters = string.ascii_lowercase
-    return "".join(random.choice(letters) for i in range(string_length))
+    return "".join(random.choices(string.ascii_lowercase, k=string_length))
 
 
 def open_image_from_url(url: str):
@@ -320,13 +354,15 @@ def open_image_from_url(url: str):
     """
     from PIL import Image
 
-    from io import BytesIO
-
     # from urllib.parse import urlparse
 
     try:
-        response = requests.get(url)
-        img = Image.open(BytesIO(response.content))
+        with _SESSION.get(url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            img = Image.open(response.raw)
+            # Read the pixel data before the connection is released.
+            img.load()
         return img
     except Exception as e:
         print(e)
@@ -343,7 +379,6 @@ def show_image(
         height (int, optional): Height of the image in pixels. Defaults to None.
 
     """
-    from IPython.display import display
 
     try:
         out = widgets.Output()
@@ -409,7 +444,6 @@ def display_html(
     Returns:
         None
     """
-    from IPython.display import IFrame, display
 
     if isinstance(html, str) and html.startswith("<"):
         # If the input is an HTML string
@@ -456,7 +490,6 @@ def upload_to_imgur(in_gif: str):
     Args:
         in_gif (str): The file path to the image.
     """
-    import subprocess
 
     pkg_name = "imgur-uploader"
     if not _is_tool(pkg_name):
@@ -500,21 +533,23 @@ def rgb_to_hex(rgb: Optional[Tuple[int, int, int]] = (255, 255, 255)) -> str:
     Returns:
         str: hex color code
     """
-    return "%02x%02x%02x" % rgb
+    return bytes(rgb).hex()
 
 
 def hex_to_rgb(value: Optional[str] = "FFFFFF") -> Tuple[int, int, int]:
     """Converts hex color to RGB color.
 
     Args:
-        value (str, optional): Hex color code as a string. Defaults to 'FFFFFF'.
+        value (str, optional): Hex color code as a string, e.g., '#ff0000' or 'f00'. Defaults to 'FFFFFF'.
 
     Returns:
         tuple: RGB color as a tuple.
     """
     value = value.lstrip("#")
-    lv = len(value)
-    return tuple(int(value[i : i + lv // 3], 16) for i in range(0, lv, lv // 3))
+    if len(value) == 3:
+        # Expand shorthand hex codes, e.g., 'f0a' -> 'ff00aa'
+        value = "".join(c * 2 for c in value)
+    return tuple(bytes.fromhex(value))
 
 
 def check_color(in_color: Union[str, Tuple, List]) -> str:
@@ -526,20 +561,35 @@ def check_color(in_color: Union[str, Tuple, List]) -> str:
     Returns:
         str: A hex color code.
     """
+    if isinstance(in_color, (tuple, list)):
+        # rescale color if necessary. This is done before the cache lookup
+        # because (1, 1, 1) and (1.0, 1.0, 1.0) hash alike but differ in meaning.
+        if len(in_color) == 3 and all(isinstance(item, int) for item in in_color):
+            # Ensure values are floats between 0 and 1 for to_hex
+            in_color = [c / 255.0 for c in in_color]
+        return _check_color(tuple(in_color))
+    elif isinstance(in_color, str):
+        return _check_color(in_color)
+
+    print(
+        f"The provided color type ({type(in_color)}) is invalid. Using the default black color."
+    )
+    return "#000000"
+
+
+@functools.lru_cache(maxsize=1024)
+def _check_color(in_color: Union[str, Tuple]) -> str:
+    """Cached implementation of check_color for hashable inputs."""
     from matplotlib import colors
 
     out_color = "#000000"  # default black color
-    # Handle RGB tuple or list
-    if isinstance(in_color, (tuple, list)) and len(in_color) == 3:
-        # rescale color if necessary
-        if all(isinstance(item, int) for item in in_color):
-            # Ensure values are floats between 0 and 1 for to_hex
-            in_color = [c / 255.0 for c in in_color]
+    # Handle RGB tuple
+    if isinstance(in_color, tuple) and len(in_color) == 3:
         try:
             return colors.to_hex(in_color)
         except ValueError:
             print(
-                f"The provided RGB color ({in_color}) is invalid. Using the default black color."
+                f"The provided RGB color ({list(in_color)}) is invalid. Using the default black color."
             )
             return out_color
 
@@ -564,6 +614,78 @@ def check_color(in_color: Union[str, Tuple, List]) -> str:
         return out_color
 
 
+def _font_directories() -> List[str]:
+    """Returns the existing system and user font directories of the current platform."""
+    home = os.path.expanduser("~")
+    if sys.platform == "win32":
+        font_dirs = [
+            os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts"),
+            os.path.join(
+                os.environ.get("LOCALAPPDATA", ""), "Microsoft", "Windows", "Fonts"
+            ),
+        ]
+    elif sys.platform == "darwin":
+        font_dirs = [
+            "/Library/Fonts",
+            "/System/Library/Fonts",
+            "/Network/Library/Fonts",
+            os.path.join(home, "Library", "Fonts"),
+        ]
+    else:
+        font_dirs = [
+            "/usr/share/fonts",
+            "/usr/local/share/fonts",
+            os.path.join(home, ".fonts"),
+            os.path.join(home, ".local", "share", "fonts"),
+        ]
+    return [font_dir for font_dir in font_dirs if os.path.isdir(font_dir)]
+
+
+def _font_directories_mtime() -> float:
+    """Returns the latest modification time of the font directories and their subdirectories."""
+    mtimes = [0.0]
+    for font_dir in _font_directories():
+        mtimes.append(os.path.getmtime(font_dir))
+        with os.scandir(font_dir) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    mtimes.append(entry.stat().st_mtime)
+    return max(mtimes)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_system_fonts() -> Tuple[str, ...]:
+    """Returns the sorted paths of the system fonts.
+
+    The list is cached in ~/.cache/leafmap/fonts.json so that new processes can skip
+    walking the font directories. The cache is rebuilt when a font directory changes.
+    """
+    cache_file = os.path.join(
+        os.path.expanduser("~"), ".cache", "leafmap", "fonts.json"
+    )
+
+    try:
+        if os.path.getmtime(cache_file) > _font_directories_mtime():
+            with open(cache_file, "r") as f:
+                return tuple(json.load(f))
+    except (OSError, ValueError):
+        pass
+
+    import matplotlib.font_manager
+
+    font_list = matplotlib.font_manager.findSystemFonts(fontpaths=None, fontext="ttf")
+    font_list = tuple(sorted(font_list))
+
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(cache_file, "w") as f:
+            json.dump(font_list, f)
+    except OSError:
+        pass
+
+    return font_list
+
+
 def system_fonts(show_full_path: Optional[bool] = False) -> List:
     """Gets a list of system fonts
 
@@ -579,12 +701,7 @@ def system_fonts(show_full_path: Optional[bool] = False) -> List:
         list: A list of system fonts.
     """
     try:
-        import matplotlib.font_manager
-
-        font_list = matplotlib.font_manager.findSystemFonts(
-            fontpaths=None, fontext="ttf"
-        )
-        font_list.sort()
+        font_list = list(_find_system_fonts())
 
         font_names = [os.path.basename(f) for f in font_list]
         font_names.sort()
@@ -598,6 +715,68 @@ def system_fonts(show_full_path: Optional[bool] = False) -> List:
         raise Exception(e)
 
 
+def _stream_download(url: str, out_file_path: str, timeout: int = 30) -> None:
+    """Streams the content of a URL to a local file in large chunks.
+
+    Args:
+        url (str): The HTTP URL to download.
+        out_file_path (str): The path to the output file.
+        timeout (int, optional): The request timeout in seconds. Defaults to 30.
+    """
+    with _SESSION.get(url, stream=True, timeout=timeout) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        with open(out_file_path, "wb") as f:
+            shutil.copyfileobj(response.raw, f, length=_COPY_BUFSIZE)
+
+
+def _extract_zip(zip_ref: zipfile.ZipFile, out_dir: str) -> None:
+    """Extracts all members of a zip archive using a pool of threads.
+
+    Args:
+        zip_ref (zipfile.ZipFile): An open zip archive.
+        out_dir (str): The directory to extract the members to.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    members = [member for member in zip_ref.infolist() if not member.is_dir()]
+
+    # Create the directory tree up front so that worker threads do not race on it.
+    for member in zip_ref.infolist():
+        if member.is_dir():
+            dirname = member.filename
+        else:
+            dirname = os.path.dirname(member.filename)
+        parts = [part for part in dirname.split("/") if part not in ("", ".", "..")]
+        os.makedirs(os.path.join(out_dir, *parts), exist_ok=True)
+
+    max_workers = min(8, os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(lambda member: zip_ref.extract(member, out_dir), members))
+
+
+def _extract_tar(tar_ref: tarfile.TarFile, out_dir: str) -> None:
+    """Extracts all members of a tar archive, refusing members outside out_dir.
+
+    Args:
+        tar_ref (tarfile.TarFile): An open tar archive.
+        out_dir (str): The directory to extract the members to.
+    """
+    if hasattr(tarfile, "data_filter"):
+        # The "data" filter (Python 3.12+, backported to earlier patch releases)
+        # checks each member as it is extracted, so no separate pass is needed.
+        tar_ref.extractall(out_dir, filter="data")
+        return
+
+    abs_directory = os.path.abspath(out_dir)
+    for member in tar_ref.getmembers():
+        member_path = os.path.abspath(os.path.join(out_dir, member.name))
+        if os.path.commonprefix([abs_directory, member_path]) != abs_directory:
+            raise Exception("Attempted Path Traversal in Tar File")
+
+    tar_ref.extractall(out_dir)
+
+
 def download_from_url(
     url: str,
     out_file_name: Optional[str] = None,
@@ -625,7 +804,7 @@ def download_from_url(
         print("Downloading {} ...".format(url))
 
     try:
-        urllib.request.urlretrieve(url, out_file_path)
+        _stream_download(url, out_file_path)
     except Exception:
         raise Exception("The URL is invalid. Please double check the URL.")
 
@@ -637,7 +816,7 @@ def download_from_url(
             if verbose:
                 print("Unzipping {} ...".format(out_file_name))
             with zipfile.ZipFile(out_file_path, "r") as zip_ref:
-                zip_ref.extractall(out_dir)
+                _extract_zip(zip_ref, out_dir)
             final_path = os.path.join(
                 os.path.abspath(out_dir), out_file_name.replace(".zip", "")
             )
@@ -646,28 +825,11 @@ def download_from_url(
         if ".tar" in out_file_name:
             if verbose:
                 print("Unzipping {} ...".format(out_file_name))
-            with tarfile.open(out_file_path, "r") as tar_ref:
-                with tarfile.open(out_file_path, "r") as tar_ref:
-
-                    def is_within_directory(directory, target):
-                        abs_directory = os.path.abspath(directory)
-                        abs_target = os.path.abspath(target)
-
-                        prefix = os.path.commonprefix([abs_directory, abs_target])
-
-                        return prefix == abs_directory
-
-                    def safe_extract(
-                        tar, path=".", members=None, *, numeric_owner=False
-                    ):
-                        for member in tar.getmembers():
-                            member_path = os.path.join(path, member.name)
-                            if not is_within_directory(path, member_path):
-                                raise Exception("Attempted Path Traversal in Tar File")
-
-                        tar.extractall(path, members, numeric_owner=numeric_owner)
-
-                    safe_extract(tar_ref, out_dir)
+            with open(out_file_path, "rb", buffering=_COPY_BUFSIZE) as f:
+                with tarfile.open(
+                    fileobj=f, mode="r", copybufsize=2 * _COPY_BUFSIZE
+                ) as tar_ref:
+                    _extract_tar(tar_ref, out_dir)
 
             final_path = os.path.join(
                 os.path.abspath(out_dir), out_file_name.replace(".tart", "")
@@ -677,6 +839,28 @@ def download_from_url(
         print("Data downloaded to: {}".format(final_path))
 
 
+def _b64encode_file(filename: str, chunk_size: int = 3 << 20) -> str:
+    """Base64-encodes a file in chunks rather than reading it into memory at once.
+
+    Args:
+        filename (str): The file path to encode.
+        chunk_size (int, optional): The number of bytes to read per chunk. It must be
+            a multiple of 3 so that no padding is emitted mid-stream. Defaults to 3 MiB.
+
+    Returns:
+        str: The base64-encoded file content.
+    """
+
+    encoded = bytearray()
+    with open(filename, "rb", buffering=_COPY_BUFSIZE) as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            encoded += base64.b64encode(chunk)
+    return encoded.decode("ascii")
+
+
 def create_download_link(filename, title="Click here to download: ", basename=None):
     """Downloads a file from voila. Adopted from https://github.com/voila-dashboards/voila/issues/578
 
@@ -687,12 +871,8 @@ def create_download_link(filename, title="Click here to download: ", basename=No
     Returns:
         str: HTML download URL.
     """
-    import base64
-    from IPython.display import HTML
 
-    data = open(filename, "rb").read()
-    b64 = base64.b64encode(data)
-    payload = b64.decode()
+    payload = _b64encode_file(filename)
     if basename is None:
         basename = os.path.basename(filename)
     html = '<a download="{filename}" href="data:text/csv;base64,{payload}" style="color:#0000FF;" target="_blank">{title}</a>'
@@ -711,15 +891,12 @@ def edit_download_html(htmlWidget, filename, title="Click here to download: "):
 
     # from IPython.display import HTML
     # import ipywidgets as widgets
-    import base64
 
     # Change widget html temporarily to a font-awesome spinner
     htmlWidget.value = '<i class="fa fa-spinner fa-spin fa-2x fa-fw"></i><span class="sr-only">Loading...</span>'
 
     # Process raw data
-    data = open(filename, "rb").read()
-    b64 = base64.b64encode(data)
-    payload = b64.decode()
+    payload = _b64encode_file(filename)
 
     basename = os.path.basename(filename)
 
@@ -788,14 +965,18 @@ def csv_to_shp(
         in_csv = download_file(in_csv, quiet=True, overwrite=True)
 
     try:
+        # Parse the CSV once in C; keep the raw strings for the attribute table.
+        df = pd.read_csv(in_csv, encoding=encoding, dtype=str, keep_default_na=False)
+        lons = df[longitude].astype(float).tolist()
+        lats = df[latitude].astype(float).tolist()
+
         points = shp.Writer(out_shp, shapeType=shp.POINT)
-        with open(in_csv, encoding=encoding) as csvfile:
-            csvreader = csv.DictReader(csvfile)
-            header = csvreader.fieldnames
-            [points.field(field) for field in header]
-            for row in csvreader:
-                points.point((float(row[longitude])), (float(row[latitude])))
-                points.record(*tuple([row[f] for f in header]))
+        for field in df.columns:
+            points.field(field)
+        for lon, lat, record in zip(lons, lats, df.itertuples(index=False, name=None)):
+            points.point(lon, lat)
+            points.record(*record)
+        points.close()
 
         out_prj = out_shp.replace(".shp", ".prj")
         with open(out_prj, "w") as f:
@@ -806,6 +987,79 @@ def csv_to_shp(
         raise Exception(e)
 
 
+def _json_default(obj):
+    """Serializes objects that the JSON encoders do not support natively.
+
+    Args:
+        obj (object): The object to serialize, e.g., a pandas Timestamp.
+
+    Raises:
+        TypeError: If the object is not supported.
+
+    Returns:
+        str: The ISO 8601 representation of a date or time.
+    """
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _read_json(in_file: str, encoding: str = "utf-8"):
+    """Reads a JSON file, using orjson if it is installed.
+
+    Args:
+        in_file (str): The path to the input file.
+        encoding (str, optional): The encoding of characters. Defaults to "utf-8".
+
+    Returns:
+        dict | list: The deserialized object.
+    """
+    try:
+        import orjson
+    except ImportError:
+        with open(in_file, encoding=encoding) as f:
+            return json.load(f)
+
+    if codecs.lookup(encoding).name == "utf-8":
+        with open(in_file, "rb") as f:
+            return orjson.loads(f.read())
+    with open(in_file, encoding=encoding) as f:
+        return orjson.loads(f.read())
+
+
+def _write_json(
+    data, out_file: str, encoding: str = "utf-8", indent: Optional[int] = None
+) -> None:
+    """Writes a JSON-serializable object to a file, using orjson if it is installed.
+
+    Args:
+        data (dict | list): The object to serialize.
+        out_file (str): The path to the output file.
+        encoding (str, optional): The encoding of characters. orjson always produces UTF-8,
+            so other encodings use the json module, which escapes non-ASCII characters.
+            Defaults to "utf-8".
+        indent (int, optional): The indentation of the JSON file. orjson only supports
+            an indentation of 2, so other values use the json module. Defaults to None.
+    """
+    orjson = None
+    if indent in (None, 2) and codecs.lookup(encoding).name == "utf-8":
+        try:
+            import orjson
+        except ImportError:
+            pass
+
+    if orjson is None:
+        with open(out_file, "w", encoding=encoding) as f:
+            f.write(json.dumps(data, default=_json_default, indent=indent))
+        return
+
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if indent == 2:
+        option |= orjson.OPT_INDENT_2
+    with open(out_file, "wb") as f:
+        f.write(orjson.dumps(data, default=_json_default, option=option))
+
+
 def df_to_geojson(
     df,
     out_geojson=None,
@@ -824,29 +1078,31 @@ def df_to_geojson(
 
     """
 
-    import json
-    from geojson import Feature, FeatureCollection, Point
-
     if out_geojson is not None:
         out_dir = os.path.dirname(os.path.abspath(out_geojson))
         if not os.path.exists(out_dir):
             os.makedirs(out_dir)
 
-    features = df.apply(
-        lambda row: Feature(
-            geometry=Point((float(row[longitude]), float(row[latitude]))),
-            properties=dict(row),
-        ),
-        axis=1,
-    ).tolist()
+    # Extract the coordinates column-wise instead of building a Series per row.
+    lons = df[longitude].to_numpy(dtype=float).tolist()
+    lats = df[latitude].to_numpy(dtype=float).tolist()
+    records = df.to_dict(orient="records")
+
+    features = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [lon, lat]},
+            "properties": properties,
+        }
+        for lon, lat, properties in zip(lons, lats, records)
+    ]
 
-    geojson = FeatureCollection(features=features)
+    geojson = {"type": "FeatureCollection", "features": features}
 
     if out_geojson is None:
         return geojson
     else:
-        with open(out_geojson, "w", encoding=encoding) as f:
-            f.write(json.dumps(geojson))
+        _write_json(geojson, out_geojson, encoding=encoding)
 
 
 def csv_to_geojson(
@@ -874,7 +1130,11 @@ def csv_to_geojson(
     if out_geojson is not None:
         out_geojson = check_file_path(out_geojson)
 
-    df = pd.read_csv(in_csv)
+    df = pd.read_csv(
+        in_csv,
+        encoding=encoding,
+        dtype={longitude: "float64", latitude: "float64"},
+    )
     geojson = df_to_geojson(
         df, latitude=latitude, longitude=longitude, encoding=encoding
     )
@@ -882,8 +1142,7 @@ def csv_to_geojson(
     if out_geojson is None:
         return geojson
     else:
-        with open(out_geojson, "w", encoding=encoding) as f:
-            f.write(json.dumps(geojson))
+        _write_json(geojson, out_geojson, encoding=encoding)
 
 
 def csv_to_gdf(
@@ -913,19 +1172,23 @@ def csv_to_gdf(
 
     import geopandas as gpd
     import pandas as pd
-    from shapely import wkt
 
-    out_dir = os.getcwd()
+    in_csv = github_raw_url(in_csv)
 
     if geometry is None:
-        out_geojson = os.path.join(out_dir, random_string() + ".geojson")
-        csv_to_geojson(in_csv, out_geojson, latitude, longitude, encoding=encoding)
+        # Declaring the coordinate dtypes up front skips type inference for them.
+        dtype = {longitude: "float64", latitude: "float64"}
+    else:
+        dtype = None
+    df = pd.read_csv(in_csv, encoding=encoding, dtype=dtype)
 
-        gdf = gpd.read_file(out_geojson)
-        os.remove(out_geojson)
+    if geometry is None:
+        points = gpd.points_from_xy(
+            df[longitude].to_numpy(), df[latitude].to_numpy(), crs=crs
+        )
+        gdf = gpd.GeoDataFrame(df, geometry=points, crs=crs, **kwargs)
     else:
-        df = pd.read_csv(in_csv, encoding=encoding)
-        df["geometry"] = df[geometry].apply(wkt.loads)
+        df["geometry"] = gpd.GeoSeries.from_wkt(df[geometry]).values
         gdf = gpd.GeoDataFrame(df, geometry="geometry", crs=crs, **kwargs)
     return gdf
 
@@ -965,29 +1228,24 @@ def create_code_cell(code="", where="below"):
         where (str, optional): Where to add the new code cell. It can be one of the following: above, below, at_bottom. Defaults to 'below'.
     """
 
-    import base64
-
     # try:
     #     import pyperclip
     # except ImportError:
     #     install_package("pyperclip")
     #     import pyperclip
 
-    from IPython.display import Javascript, display
-
     # try:
     #     pyperclip.copy(str(code))
     # except Exception as e:
     #     pass
 
-    encoded_code = (base64.b64encode(str.encode(code))).decode()
     display(
         Javascript(
             """
         var code = IPython.notebook.insert_cell_{0}('code');
-        code.set_text(atob("{1}"));
+        code.set_text({1});
     """.format(
-                where, encoded_code
+                where, json.dumps(code)
             )
         )
     )
@@ -1016,6 +1274,91 @@ def local_tile_pixel_value(
     return tile_client.point(lon, lat, coord_crs="EPSG:4326", **kwargs)
 
 
+@functools.lru_cache(maxsize=32)
+def _cached_tile_client(
+    source, mtime=None, port="default", debug=False, client_args=()
+):
+    """Creates a TileClient for a source, reusing it while the file is unchanged.
+
+    Args:
+        source (str): A local file path or URL.
+        mtime (float, optional): The modification time of the local file. It only
+            serves as part of the cache key. Defaults to None.
+        port (str, optional): The port to use for the server. Defaults to "default".
+        debug (bool, optional): If True, the server will be started in debug mode. Defaults to False.
+        client_args (tuple, optional): Sorted (key, value) pairs of additional
+            arguments to pass to the TileClient. Defaults to ().
+
+    Returns:
+        TileClient: The TileClient object.
+    """
+    from localtileserver import TileClient
+
+    return TileClient(source, port=port, debug=debug, **dict(client_args))
+
+
+def _get_tile_client(source, port="default", debug=False, client_args=None):
+    """Returns a cached TileClient for a source, creating it on the first call.
+
+    Args:
+        source (str): A local file path or URL.
+        port (str, optional): The port to use for the server. Defaults to "default".
+        debug (bool, optional): If True, the server will be started in debug mode. Defaults to False.
+        client_args (dict, optional): Additional arguments to pass to the TileClient. Defaults to None.
+
+    Returns:
+        TileClient: The TileClient object.
+    """
+    client_args = tuple(sorted((client_args or {}).items()))
+    key = (*_tile_cache_key(source), port, debug, client_args)
+    try:
+        hash(key)
+    except TypeError:
+        # Unhashable client arguments cannot be cached.
+        from localtileserver import TileClient
+
+        return TileClient(source, port=port, debug=debug, **dict(client_args))
+    return _cached_tile_client(*key)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_tile_statistics(source, mtime=None):
+    """Computes the band statistics of a source, reusing them while the file is unchanged.
+
+    Args:
+        source (str): A local file path or URL.
+        mtime (float, optional): The modification time of the local file. Defaults to None.
+
+    Returns:
+        dict: The band statistics keyed by band name.
+    """
+    return _cached_tile_client(source, mtime).reader.statistics()
+
+
+def _tile_cache_key(source):
+    """Returns the cache key (absolute path and mtime) of a local file path or URL.
+
+    Args:
+        source (str): A local file path or URL.
+
+    Returns:
+        tuple: A tuple of the source and its modification time (None for URLs).
+    """
+    if os.path.exists(source):
+        source = os.path.abspath(source)
+        return source, os.path.getmtime(source)
+    return source, None
+
+
+def clear_tile_cache():
+    """Clears the cached TileClient objects and band statistics used by
+    get_local_tile_layer(), get_local_tile_url(), local_tile_vmin_vmax() and
+    local_tile_bands().
+    """
+    _cached_tile_statistics.cache_clear()
+    _cached_tile_client.cache_clear()
+
+
 def local_tile_vmin_vmax(
     source,
     bands=None,
@@ -1037,14 +1380,16 @@ def local_tile_vmin_vmax(
     from localtileserver import TileClient
 
     if isinstance(source, str):
-        tile_client = TileClient(source)
+        key = _tile_cache_key(source)
+        tile_client = _cached_tile_client(*key)
+        stats = _cached_tile_statistics(*key)
     elif isinstance(source, TileClient):
         tile_client = source
+        stats = tile_client.reader.statistics()
     else:
         raise ValueError("source must be a string or TileClient object.")
 
     bandnames = tile_client.band_names
-    stats = tile_client.reader.statistics()
 
     if isinstance(bands, str):
         bands = [bands]
@@ -1053,12 +1398,15 @@ def local_tile_vmin_vmax(
     elif bands is None:
         bands = bandnames
 
-    if all(b in bandnames for b in bands):
-        vmin = min([stats[b]["min"] for b in bands])
-        vmax = max([stats[b]["max"] for b in bands])
-    else:
-        vmin = min([stats[b]["min"] for b in bandnames])
-        vmax = max([stats[b]["max"] for b in bandnames])
+    if not set(bands).issubset(bandnames):
+        bands = bandnames
+    arr = np.fromiter(
+        (v for b in bands for v in (stats[b]["min"], stats[b]["max"])),
+        dtype=np.float64,
+        count=2 * len(bands),
+    ).reshape(-1, 2)
+    vmin = float(arr[:, 0].min())
+    vmax = float(arr[:, 1].max())
     return vmin, vmax
 
 
@@ -1075,7 +1423,7 @@ def local_tile_bands(source):
     from localtileserver import TileClient
 
     if isinstance(source, str):
-        tile_client = TileClient(source)
+        tile_client = _cached_tile_client(*_tile_cache_key(source))
     elif isinstance(source, TileClient):
         tile_client = source
     else:
@@ -1094,19 +1442,22 @@ def bbox_to_geojson(bounds):
         dict: A geojson feature.
     """
 
-    if isinstance(bounds, tuple) and len(bounds) == 2:
-        bounds = [bounds[0][1], bounds[0][0], bounds[1][1], bounds[1][0]]
+    if len(bounds) == 4:
+        left, bottom, right, top = bounds
+    else:
+        # m.bounds, i.e., ((south, west), (north, east))
+        (bottom, left), (top, right) = bounds
 
     return {
         "geometry": {
             "type": "Polygon",
             "coordinates": [
                 [
-                    [bounds[0], bounds[3]],
-                    [bounds[0], bounds[1]],
-                    [bounds[2], bounds[1]],
-                    [bounds[2], bounds[3]],
-                    [bounds[0], bounds[3]],
+                    [left, top],
+                    [left, bottom],
+                    [right, bottom],
+                    [right, top],
+                    [left, top],
                 ]
             ],
         },
@@ -1114,20 +1465,102 @@ def bbox_to_geojson(bounds):
     }
 
 
-def coords_to_geojson(coords):
+def _bbox_array(coords):
+    """Stacks a list of bounding boxes into an (N, 4) array.
+
+    Args:
+        coords (list): A list of bounding boxes, each either [left, bottom, right, top]
+            or m.bounds, i.e., ((south, west), (north, east)).
+
+    Raises:
+        ValueError: If coords is not a list of bounding boxes.
+
+    Returns:
+        np.ndarray: A float64 array with rows of [left, bottom, right, top].
+    """
+    try:
+        arr = np.asarray(coords, dtype=np.float64)
+    except ValueError:
+        # A mix of both forms; normalize each item as bbox_to_geojson does.
+        rows = []
+        for bounds in coords:
+            if len(bounds) == 4:
+                rows.append(bounds)
+            else:
+                (bottom, left), (top, right) = bounds
+                rows.append((left, bottom, right, top))
+        arr = np.asarray(rows, dtype=np.float64)
+
+    if arr.size == 0:
+        return arr.reshape(0, 4)
+    if arr.ndim == 3 and arr.shape[1:] == (2, 2):
+        # ((south, west), (north, east)) -> [west, south, east, north]
+        return np.column_stack([arr[:, 0, 1], arr[:, 0, 0], arr[:, 1, 1], arr[:, 1, 0]])
+    if arr.ndim != 2 or arr.shape[1] != 4:
+        raise ValueError(
+            "coords must be a list of bounding boxes, e.g., [[left, bottom, right, top], ...]."
+        )
+    return arr
+
+
+def _bbox_features(arr):
+    """Creates GeoJSON polygon features from an (N, 4) array of bounding boxes.
+
+    Args:
+        arr (np.ndarray): A float64 array with rows of [left, bottom, right, top].
+
+    Returns:
+        list: A list of geojson features.
+    """
+    # Build every ring at once: x = [left, left, right, right, left] and
+    # y = [top, bottom, bottom, top, top], matching bbox_to_geojson.
+    rings = np.stack(
+        [arr[:, [0, 0, 2, 2, 0]], arr[:, [3, 1, 1, 3, 3]]], axis=-1
+    ).tolist()
+    return [
+        {"geometry": {"type": "Polygon", "coordinates": [ring]}, "type": "Feature"}
+        for ring in rings
+    ]
+
+
+def coords_to_geojson(coords, stream_to=None, chunk_size=100000):
     """Convert a list of bbox coordinates representing [left, bottom, right, top] to geojson FeatureCollection.
 
     Args:
         coords (list): A list of bbox coordinates representing [left, bottom, right, top].
+        stream_to (str, optional): The file path to write the FeatureCollection to. The features
+            are serialized chunk by chunk so that the whole collection is never held in memory.
+            Defaults to None.
+        chunk_size (int, optional): The number of features to serialize at a time when
+            stream_to is set. Defaults to 100000.
 
     Returns:
-        dict: A geojson FeatureCollection.
+        dict: A geojson FeatureCollection, or None if stream_to is set.
     """
 
-    features = []
-    for bbox in coords:
-        features.append(bbox_to_geojson(bbox))
-    return {"type": "FeatureCollection", "features": features}
+    arr = _bbox_array(coords)
+    if stream_to is None:
+        return {"type": "FeatureCollection", "features": _bbox_features(arr)}
+
+    try:
+        import orjson
+
+        dumps = orjson.dumps
+    except ImportError:
+
+        def dumps(data):
+            return json.dumps(data).encode("utf-8")
+
+    stream_to = os.path.abspath(stream_to)
+    os.makedirs(os.path.dirname(stream_to), exist_ok=True)
+    with open(stream_to, "wb") as f:
+        f.write(b'{"type": "FeatureCollection", "features": [')
+        for start in range(0, len(arr), chunk_size):
+            if start:
+                f.write(b",")
+            # Strip the brackets of the serialized list to splice it into the array.
+            f.write(dumps(_bbox_features(arr[start : start + chunk_size]))[1:-1])
+        f.write(b"]}")
 
 
 def explode(coords):
@@ -1142,16 +1575,103 @@ def explode(coords):
         [type]: [description]
     """
 
-    for e in coords:
-        if isinstance(e, (float, int)):
-            yield coords
-            break
+    # Walk the nested lists with an explicit stack rather than one generator per level.
+    stack = [coords]
+    while stack:
+        e = stack.pop()
+        if not e:
+            continue
+        if isinstance(e[0], (float, int)):
+            yield e
+        else:
+            stack.extend(reversed(e))
+
+
+def _coords_to_xy(coords):
+    """Flattens the coordinates of a GeoJSON geometry into an (N, 2) array of x and y.
+
+    Args:
+        coords (list): The coordinates of a GeoJSON geometry.
+
+    Returns:
+        np.ndarray: A float64 array with one row per position.
+    """
+    if isinstance(coords[0], (float, int)):
+        # A single position, e.g., a Point
+        return np.asarray([coords[:2]], dtype=np.float64)
+
+    arrays = []
+    stack = [coords]
+    while stack:
+        item = stack.pop()
+        if isinstance(item[0][0], (float, int)):
+            # A sequence of positions, e.g., a LineString or a Polygon ring
+            try:
+                arrays.append(np.asarray(item, dtype=np.float64)[:, :2])
+            except ValueError:
+                # Positions with a mix of 2 and 3 dimensions
+                arrays.append(np.asarray([p[:2] for p in item], dtype=np.float64))
         else:
-            for f in explode(e):
-                yield f
+            stack.extend(item)
+    return np.concatenate(arrays)
+
+
+def _bbox_xy(xy):
+    """Computes the bounds of an (N, 2) coordinate array.
+
+    Args:
+        xy (np.ndarray): A float64 array of x and y.
+
+    Returns:
+        tuple: A tuple of (xmin, ymin, xmax, ymax).
+    """
+    xmin, ymin = xy.min(axis=0)
+    xmax, ymax = xy.max(axis=0)
+    return xmin, ymin, xmax, ymax
+
+
+def _wrap_lons_inplace(lons):
+    """Shifts longitudes less than -180 or greater than 180 by 360 degrees in place.
 
+    Args:
+        lons (np.ndarray): A 1-D float64 array of longitudes.
+    """
+    lons[lons < -180] += 360
+    lons[lons > 180] -= 360
+
+
+if _njit is not None:
+    # When numba is installed, replace the NumPy versions above with compiled
+    # kernels that make a single pass over the array.
 
-def get_bounds(geometry, north_up=True, transform=None):
+    @_njit(cache=True)
+    def _bbox_xy(xy):
+        xmin = xmax = xy[0, 0]
+        ymin = ymax = xy[0, 1]
+        for i in range(1, xy.shape[0]):
+            x = xy[i, 0]
+            y = xy[i, 1]
+            if x < xmin:
+                xmin = x
+            elif x > xmax:
+                xmax = x
+            if y < ymin:
+                ymin = y
+            elif y > ymax:
+                ymax = y
+        return xmin, ymin, xmax, ymax
+
+    @_njit(cache=True)
+    def _wrap_lons_inplace(lons):
+        for i in range(lons.shape[0]):
+            x = lons[i]
+            if x < -180:
+                lons[i] = x + 360
+            elif x > 180:
+                lons[i] = x - 360
+
+
+def get_bounds(geometry, north_up=True, transform=None, cache=False):
     """Bounding box of a GeoJSON geometry, GeometryCollection, or FeatureCollection.
     left, bottom, right, top
     *not* xmin, ymin, xmax, ymax
@@ -1162,14 +1682,20 @@ def get_bounds(geometry, north_up=True, transform=None):
         geometry (dict): A GeoJSON dict.
         north_up (bool, optional): . Defaults to True.
         transform ([type], optional): . Defaults to None.
+        cache (bool, optional): Whether to store the computed bounds in the "bbox" member
+            of the input dict(s) so that later calls can skip the computation. Defaults to False.
 
     Returns:
         list: A list of coordinates representing [left, bottom, right, top]
     """
 
     if "bbox" in geometry:
-        return tuple(geometry["bbox"])
+        bbox = tuple(geometry["bbox"])
+        if north_up or len(bbox) != 4:
+            return bbox
+        return bbox[0], bbox[3], bbox[2], bbox[1]
 
+    source = geometry
     geometry = geometry.get("geometry") or geometry
 
     # geometry must be a geometry, GeometryCollection, or FeatureCollection
@@ -1181,39 +1707,17 @@ def get_bounds(geometry, north_up=True, transform=None):
             "or FeatureCollection"
         )
 
-    if "features" in geometry:
-        # Input is a FeatureCollection
-        xmins = []
-        ymins = []
-        xmaxs = []
-        ymaxs = []
-        for feature in geometry["features"]:
-            xmin, ymin, xmax, ymax = get_bounds(feature["geometry"])
-            xmins.append(xmin)
-            ymins.append(ymin)
-            xmaxs.append(xmax)
-            ymaxs.append(ymax)
-        if north_up:
-            return min(xmins), min(ymins), max(xmaxs), max(ymaxs)
-        else:
-            return min(xmins), max(ymaxs), max(xmaxs), min(ymins)
-
-    elif "geometries" in geometry:
-        # Input is a geometry collection
-        xmins = []
-        ymins = []
-        xmaxs = []
-        ymaxs = []
-        for geometry in geometry["geometries"]:
-            xmin, ymin, xmax, ymax = get_bounds(geometry)
-            xmins.append(xmin)
-            ymins.append(ymin)
-            xmaxs.append(xmax)
-            ymaxs.append(ymax)
-        if north_up:
-            return min(xmins), min(ymins), max(xmaxs), max(ymaxs)
+    if "features" in geometry or "geometries" in geometry:
+        # Input is a FeatureCollection or a GeometryCollection
+        if "features" in geometry:
+            parts = [feature["geometry"] for feature in geometry["features"]]
         else:
-            return min(xmins), max(ymaxs), max(xmaxs), min(ymins)
+            parts = geometry["geometries"]
+        bounds = np.array(
+            [get_bounds(part, cache=cache) for part in parts], dtype=np.float64
+        )
+        xmin, ymin = bounds[:, :2].min(axis=0).tolist()
+        xmax, ymax = bounds[:, 2:4].max(axis=0).tolist()
 
     elif "coordinates" in geometry:
         # Input is a singular geometry object
@@ -1222,32 +1726,32 @@ def get_bounds(geometry, north_up=True, transform=None):
             xyz_px = [transform * point for point in xyz]
             xyz = tuple(zip(*xyz_px))
             return min(xyz[0]), max(xyz[1]), max(xyz[0]), min(xyz[1])
-        else:
-            xyz = tuple(zip(*list(explode(geometry["coordinates"]))))
-            if north_up:
-                return min(xyz[0]), min(xyz[1]), max(xyz[0]), max(xyz[1])
-            else:
-                return min(xyz[0]), max(xyz[1]), max(xyz[0]), min(xyz[1])
+        xy = _coords_to_xy(geometry["coordinates"])
+        xmin, ymin, xmax, ymax = (float(v) for v in _bbox_xy(xy))
 
-    # all valid inputs returned above, so whatever falls through is an error
-    raise ValueError(
-        "geometry must be a GeoJSON-like geometry, GeometryCollection, "
-        "or FeatureCollection"
-    )
+    if cache:
+        source["bbox"] = [xmin, ymin, xmax, ymax]
+
+    if north_up:
+        return xmin, ymin, xmax, ymax
+    else:
+        return xmin, ymax, xmax, ymin
 
 
-def get_center(geometry, north_up=True, transform=None):
+def get_center(geometry, north_up=True, transform=None, cache=False):
     """Get the centroid of a GeoJSON.
 
     Args:
         geometry (dict): A GeoJSON dict.
         north_up (bool, optional): . Defaults to True.
         transform ([type], optional): . Defaults to None.
+        cache (bool, optional): Whether to store the computed bounds in the "bbox" member
+            of the input dict(s). See get_bounds(). Defaults to False.
 
     Returns:
         list: [lon, lat]
     """
-    bounds = get_bounds(geometry, north_up, transform)
+    bounds = get_bounds(geometry, north_up, transform, cache=cache)
     center = ((bounds[0] + bounds[2]) / 2, (bounds[1] + bounds[3]) / 2)  # (lat, lon)
     return center
 
@@ -1265,65 +1769,33 @@ def adjust_longitude(in_fc):
         keys = in_fc.keys()
 
         if "geometry" in keys:
-            coordinates = in_fc["geometry"]["coordinates"]
-
-            if in_fc["geometry"]["type"] == "Point":
-                longitude = coordinates[0]
-                if longitude < -180:
-                    longitude = 360 + longitude
-                elif longitude > 180:
-                    longitude = longitude - 360
-                in_fc["geometry"]["coordinates"][0] = longitude
-
-            elif in_fc["geometry"]["type"] == "Polygon":
-                for index1, item in enumerate(coordinates):
-                    for index2, element in enumerate(item):
-                        longitude = element[0]
-                        if longitude < -180:
-                            longitude = 360 + longitude
-                        elif longitude > 180:
-                            longitude = longitude - 360
-                        in_fc["geometry"]["coordinates"][index1][index2][0] = longitude
-
-            elif in_fc["geometry"]["type"] == "LineString":
-                for index, element in enumerate(coordinates):
-                    longitude = element[0]
-                    if longitude < -180:
-                        longitude = 360 + longitude
-                    elif longitude > 180:
-                        longitude = longitude - 360
-                    in_fc["geometry"]["coordinates"][index][0] = longitude
-
+            geometry = in_fc["geometry"]
         elif "type" in keys:
-            coordinates = in_fc["coordinates"]
-
-            if in_fc["type"] == "Point":
-                longitude = coordinates[0]
-                if longitude < -180:
-                    longitude = 360 + longitude
-                elif longitude > 180:
-                    longitude = longitude - 360
-                in_fc["coordinates"][0] = longitude
-
-            elif in_fc["type"] == "Polygon":
-                for index1, item in enumerate(coordinates):
-                    for index2, element in enumerate(item):
-                        longitude = element[0]
-                        if longitude < -180:
-                            longitude = 360 + longitude
-                        elif longitude > 180:
-                            longitude = longitude - 360
-                        in_fc["coordinates"][index1][index2][0] = longitude
-
-            elif in_fc["type"] == "LineString":
-                for index, element in enumerate(coordinates):
-                    longitude = element[0]
-                    if longitude < -180:
-                        longitude = 360 + longitude
-                    elif longitude > 180:
-                        longitude = longitude - 360
-                    in_fc["coordinates"][index][0] = longitude
-
+            geometry = in_fc
+        else:
+            return in_fc
+
+        coordinates = geometry["coordinates"]
+        if geometry["type"] == "Point":
+            positions = [coordinates]
+        elif geometry["type"] == "LineString":
+            positions = coordinates
+        elif geometry["type"] == "Polygon":
+            positions = [position for ring in coordinates for position in ring]
+        else:
+            return in_fc
+
+        # Wrap the longitudes in one vectorized pass and only write back the changed ones.
+        longitudes = np.fromiter(
+            (position[0] for position in positions),
+            dtype=np.float64,
+            count=len(positions),
+        )
+        wrapped = longitudes.copy()
+        _wrap_lons_inplace(wrapped)
+        for index in np.flatnonzero(wrapped != longitudes).tolist():
+            positions[index][0] = float(wrapped[index])
+
         return in_fc
 
     except Exception as e:
@@ -1331,9 +1803,19 @@ def adjust_longitude(in_fc):
         return None
 
 
-def is_GCS(in_shp):
+@functools.lru_cache(maxsize=1)
+def _epsg4326_proj4():
+    """Returns the proj4 string of EPSG:4326 as produced by pycrs.
+
+    Returns:
+        str: The proj4 string.
+    """
     import pycrs
 
+    return pycrs.parse.from_epsg_code(4326).to_proj4()
+
+
+def is_GCS(in_shp):
     if not os.path.exists(in_shp):
         raise FileNotFoundError("The input shapefile could not be found.")
 
@@ -1350,10 +1832,15 @@ def is_GCS(in_shp):
     else:
         with open(in_prj) as f:
             esri_wkt = f.read()
-        epsg4326 = pycrs.parse.from_epsg_code(4326).to_proj4()
+        # A WKT with a geographic but no projected definition is a GCS; no need to parse it.
+        if "GEOGCS" in esri_wkt and "PROJCS" not in esri_wkt:
+            return True
+
+        import pycrs
+
         try:
             crs = pycrs.parse.from_esri_wkt(esri_wkt).to_proj4()
-            if crs == epsg4326:
+            if crs == _epsg4326_proj4():
                 return True
             else:
                 return False
@@ -1361,6 +1848,28 @@ def is_GCS(in_shp):
             return False
 
 
+@functools.lru_cache(maxsize=1)
+def _vector_engine() -> str:
+    """Returns the geopandas I/O engine to use, preferring pyogrio over fiona.
+
+    pyogrio reads and writes through GDAL's vectorized interface and is several times
+    faster than fiona. fiona is only used when pyogrio is not installed.
+
+    Returns:
+        str: Either "pyogrio" or "fiona".
+    """
+    try:
+        import pyogrio  # noqa: F401
+
+        return "pyogrio"
+    except ImportError:
+        import fiona
+
+        # fiona does not enable the KML driver by default.
+        fiona.drvsupport.supported_drivers["KML"] = "rw"
+        return "fiona"
+
+
 def kml_to_shp(in_kml, out_shp):
     """Converts a KML to shapefile.
 
@@ -1384,18 +1893,15 @@ def kml_to_shp(in_kml, out_shp):
         raise TypeError("The output must be a shapefile.")
 
     out_dir = os.path.dirname(out_shp)
-    if not os.path.exists(out_dir):
-        os.makedirs(out_dir)
+    os.makedirs(out_dir, exist_ok=True)
 
     check_package(name="geopandas", URL="https://geopandas.org")
 
     import geopandas as gpd
-    import fiona
 
-    # print(fiona.supported_drivers)
-    fiona.drvsupport.supported_drivers["KML"] = "rw"
-    df = gpd.read_file(in_kml, driver="KML")
-    df.to_file(out_shp)
+    engine = _vector_engine()
+    df = gpd.read_file(in_kml, driver="KML", engine=engine)
+    df.to_file(out_shp, engine=engine)
 
 
 def kml_to_geojson(in_kml, out_geojson=None):
@@ -1423,21 +1929,17 @@ def kml_to_geojson(in_kml, out_geojson=None):
             raise TypeError("The output file must be a GeoJSON.")
 
         out_dir = os.path.dirname(out_geojson)
-        if not os.path.exists(out_dir):
-            os.makedirs(out_dir)
+        os.makedirs(out_dir, exist_ok=True)
 
     check_package(name="geopandas", URL="https://geopandas.org")
 
     import geopandas as gpd
-    import fiona
 
-    # import fiona
-    # print(fiona.supported_drivers)
-    fiona.drvsupport.supported_drivers["KML"] = "rw"
-    gdf = gpd.read_file(in_kml, driver="KML")
+    engine = _vector_engine()
+    gdf = gpd.read_file(in_kml, driver="KML", engine=engine)
 
     if out_geojson is not None:
-        gdf.to_file(out_geojson, driver="GeoJSON")
+        gdf.to_file(out_geojson, driver="GeoJSON", engine=engine)
     else:
         return gdf.__geo_interface__
 
@@ -1483,7 +1985,7 @@ def shp_to_gdf(in_shp):
     import geopandas as gpd
 
     try:
-        return gpd.read_file(in_shp)
+        return gpd.read_file(in_shp, engine=_vector_engine())
     except Exception as e:
         raise Exception(e)
 
@@ -1501,12 +2003,13 @@ def shp_to_geojson(in_shp, output=None, encoding="utf-8", crs="EPSG:4326", **kwa
     try:
         import geopandas as gpd
 
-        gdf = gpd.read_file(in_shp, **kwargs)
+        engine = kwargs.pop("engine", _vector_engine())
+        gdf = gpd.read_file(in_shp, engine=engine, **kwargs)
         gdf.to_crs(crs, inplace=True)
         if output is None:
             return gdf.__geo_interface__
         else:
-            gdf.to_file(output, driver="GeoJSON")
+            gdf.to_file(output, driver="GeoJSON", engine=engine)
     except Exception as e:
         raise Exception(e)
 
@@ -1518,16 +2021,15 @@ def delete_shp(in_shp, verbose=False):
         in_shp (str): The input shapefile to delete.
         verbose (bool, optional): Whether to print out descriptive text. Defaults to True.
     """
-    from pathlib import Path
+    import glob
 
     in_shp = os.path.abspath(in_shp)
     in_dir = os.path.dirname(in_shp)
     basename = os.path.basename(in_shp).replace(".shp", "")
 
-    files = Path(in_dir).rglob(basename + ".*")
-
-    for file in files:
-        filepath = os.path.join(in_dir, str(file))
+    for filepath in glob.glob(
+        os.path.join(glob.escape(in_dir), glob.escape(basename) + ".*")
+    ):
         os.remove(filepath)
         if verbose:
             print(f"Deleted {filepath}")
@@ -1541,6 +2043,7 @@ def vector_to_geojson(
     rows=None,
     epsg="4326",
     encoding="utf-8",
+    chunk_size=100000,
     **kwargs,
 ):
     """Converts any geopandas-supported vector dataset to GeoJSON.
@@ -1553,6 +2056,8 @@ def vector_to_geojson(
         rows (int or slice, optional): Load in specific rows by passing an integer (first n rows) or a slice() object.. Defaults to None.
         epsg (str, optional): The EPSG number to convert to. Defaults to "4326".
         encoding (str, optional): The encoding of the input file. Defaults to "utf-8".
+        chunk_size (int, optional): The number of features to convert at a time when writing
+            to out_geojson with the pyogrio engine and pyarrow installed. Defaults to 100000.
 
 
     Raises:
@@ -1565,29 +2070,17 @@ def vector_to_geojson(
     warnings.filterwarnings("ignore")
     check_package(name="geopandas", URL="https://geopandas.org")
     import geopandas as gpd
-    import fiona
+
+    engine = kwargs.pop("engine", _vector_engine())
 
     if not filename.startswith("http"):
         filename = os.path.abspath(filename)
         if filename.endswith(".zip"):
             filename = "zip://" + filename
     ext = os.path.splitext(filename)[1].lower()
+    read_kwargs = dict(bbox=bbox, mask=mask, encoding=encoding, engine=engine, **kwargs)
     if ext == ".kml":
-        fiona.drvsupport.supported_drivers["KML"] = "rw"
-        df = gpd.read_file(
-            filename,
-            bbox=bbox,
-            mask=mask,
-            rows=rows,
-            driver="KML",
-            encoding=encoding,
-            **kwargs,
-        )
-    else:
-        df = gpd.read_file(
-            filename, bbox=bbox, mask=mask, rows=rows, encoding=encoding, **kwargs
-        )
-    gdf = df.to_crs(epsg=epsg)
+        read_kwargs["driver"] = "KML"
 
     if out_geojson is not None:
         if not out_geojson.lower().endswith(".geojson"):
@@ -1595,13 +2088,55 @@ def vector_to_geojson(
 
         out_geojson = os.path.abspath(out_geojson)
         out_dir = os.path.dirname(out_geojson)
-        if not os.path.exists(out_dir):
-            os.makedirs(out_dir)
+        os.makedirs(out_dir, exist_ok=True)
 
-        gdf.to_file(out_geojson, driver="GeoJSON")
+        if (
+            rows is None
+            and bbox is None
+            and mask is None
+            and engine == "pyogrio"
+            and _has_pyogrio_arrow((3, 6, 0))
+        ):
+            import pyogrio
+
+            # Open the source once and stream it in batches of chunk_size features
+            # so that memory use is bounded by chunk_size rather than by the size
+            # of the dataset.
+            appended = False
+            with pyogrio.open_arrow(
+                filename,
+                encoding=encoding,
+                batch_size=chunk_size,
+                use_pyarrow=True,
+                **kwargs,
+            ) as (meta, reader):
+                geometry_name = meta["geometry_name"] or "wkb_geometry"
+                for batch in reader:
+                    data = batch.to_pandas()
+                    geometry = gpd.GeoSeries.from_wkb(
+                        data.pop(geometry_name).values, crs=meta["crs"]
+                    )
+                    df = gpd.GeoDataFrame(data, geometry=geometry)
+                    df.to_crs(epsg=epsg).to_file(
+                        out_geojson,
+                        driver="GeoJSON",
+                        engine=engine,
+                        append=appended,
+                    )
+                    appended = True
+            if not appended:
+                # An empty layer still produces a valid FeatureCollection.
+                df = gpd.read_file(filename, **read_kwargs)
+                df.to_crs(epsg=epsg).to_file(
+                    out_geojson, driver="GeoJSON", engine=engine
+                )
+        else:
+            df = gpd.read_file(filename, rows=rows, **read_kwargs)
+            df.to_crs(epsg=epsg).to_file(out_geojson, driver="GeoJSON", engine=engine)
 
     else:
-        return gdf.__geo_interface__
+        df = gpd.read_file(filename, rows=rows, **read_kwargs)
+        return df.to_crs(epsg=epsg).__geo_interface__
 
 
 def screen_capture(outfile, monitor=1):
@@ -1616,9 +2151,8 @@ def screen_capture(outfile, monitor=1):
     except ImportError:
         raise ImportError("Please install mss using 'pip install mss'")
 
-    out_dir = os.path.dirname(outfile)
-    if not os.path.exists(out_dir):
-        os.makedirs(out_dir)
+    out_dir = os.path.dirname(os.path.abspath(outfile))
+    os.makedirs(out_dir, exist_ok=True)
 
     if not isinstance(monitor, int):
         print("The monitor number must be an integer.")
@@ -1634,7 +2168,12 @@ def screen_capture(outfile, monitor=1):
 
 
 def gdf_to_geojson(
-    gdf, out_geojson=None, epsg=None, tuple_to_list=False, encoding="utf-8"
+    gdf,
+    out_geojson=None,
+    epsg=None,
+    tuple_to_list=False,
+    encoding="utf-8",
+    fast=False,
 ):
     """Converts a GeoDataFame to GeoJSON.
 
@@ -1644,6 +2183,9 @@ def gdf_to_geojson(
         epsg (str, optional): An EPSG string, e.g., "4326". Defaults to None.
         tuple_to_list (bool, optional): Whether to convert tuples to lists. Defaults to False.
         encoding (str, optional): The encoding to use for the GeoJSON. Defaults to "utf-8".
+        fast (bool, optional): Whether to serialize gdf.__geo_interface__ directly (with orjson
+            if it is installed) instead of writing the file with the OGR GeoJSON driver.
+            Driver-specific options such as coordinate precision are not applied. Defaults to False.
 
     Raises:
         TypeError: When the output file extension is incorrect.
@@ -1654,34 +2196,57 @@ def gdf_to_geojson(
     """
     check_package(name="geopandas", URL="https://geopandas.org")
 
-    def listit(t):
-        return list(map(listit, t)) if isinstance(t, (list, tuple)) else t
-
     try:
         if epsg is not None:
             if gdf.crs is not None and gdf.crs.to_epsg() != epsg:
                 gdf = gdf.to_crs(epsg=epsg)
-        geojson = gdf.__geo_interface__
-
-        if tuple_to_list:
-            for feature in geojson["features"]:
-                feature["geometry"]["coordinates"] = listit(
-                    feature["geometry"]["coordinates"]
-                )
 
         if out_geojson is None:
+            geojson = gdf.__geo_interface__
+
+            if tuple_to_list:
+                geometries = [
+                    feature["geometry"]
+                    for feature in geojson["features"]
+                    if feature["geometry"] is not None
+                ]
+                # A JSON round trip turns all nested tuples into lists in C.
+                try:
+                    import orjson
+
+                    coordinates = orjson.loads(
+                        orjson.dumps(
+                            [geometry["coordinates"] for geometry in geometries],
+                            option=orjson.OPT_SERIALIZE_NUMPY,
+                        )
+                    )
+                except ImportError:
+                    coordinates = json.loads(
+                        json.dumps([geometry["coordinates"] for geometry in geometries])
+                    )
+                for geometry, coords in zip(geometries, coordinates):
+                    geometry["coordinates"] = coords
+
             return geojson
         else:
+            out_geojson = os.path.abspath(out_geojson)
             ext = os.path.splitext(out_geojson)[1]
             if ext.lower() not in [".json", ".geojson"]:
                 raise TypeError(
                     "The output file extension must be either .json or .geojson"
                 )
             out_dir = os.path.dirname(out_geojson)
-            if not os.path.exists(out_dir):
-                os.makedirs(out_dir)
+            os.makedirs(out_dir, exist_ok=True)
 
-            gdf.to_file(out_geojson, driver="GeoJSON", encoding=encoding)
+            if fast:
+                _write_json(gdf.__geo_interface__, out_geojson, encoding=encoding)
+            else:
+                gdf.to_file(
+                    out_geojson,
+                    driver="GeoJSON",
+                    encoding=encoding,
+                    engine=_vector_engine(),
+                )
     except Exception as e:
         raise Exception(e)
 
@@ -1761,6 +2326,7 @@ def vector_col_names(filename, **kwargs):
 
     Args:
         filename (str): The input file path.
+        **kwargs: Additional keyword arguments, e.g., layer and encoding.
 
     Returns:
         list: The list of column names.
@@ -1768,18 +2334,29 @@ def vector_col_names(filename, **kwargs):
 
     warnings.filterwarnings("ignore")
     check_package(name="geopandas", URL="https://geopandas.org")
-    import geopandas as gpd
-    import fiona
+
+    engine = kwargs.pop("engine", _vector_engine())
+    layer = kwargs.get("layer")
 
     if not filename.startswith("http"):
         filename = os.path.abspath(filename)
-    ext = os.path.splitext(filename)[1].lower()
-    if ext == ".kml":
-        fiona.drvsupport.supported_drivers["KML"] = "rw"
-        gdf = gpd.read_file(filename, driver="KML", **kwargs)
+
+    # Only read the layer metadata; the features themselves are never parsed.
+    if engine == "pyogrio":
+        import pyogrio
+
+        info = pyogrio.read_info(filename, layer=layer, encoding=kwargs.get("encoding"))
+        col_names = list(info["fields"])
+        has_geometry = info["geometry_type"] is not None
     else:
-        gdf = gpd.read_file(filename, **kwargs)
-    col_names = gdf.columns.values.tolist()
+        import fiona
+
+        with fiona.open(filename, layer=layer) as src:
+            col_names = list(src.schema["properties"])
+            has_geometry = src.schema.get("geometry") not in (None, "None")
+
+    if has_geometry:
+        col_names.append("geometry")
     return col_names
 
 
@@ -1820,8 +2397,33 @@ def set_api_key(key: str, name: str = "GOOGLE_MAPS_API_KEY"):
     os.environ[name] = key
 
 
-def planet_monthly_tropical(api_key=None, token_name="PLANET_API_KEY"):
-    """Generates Planet monthly imagery URLs based on an API key. See https://assets.planet.com/docs/NICFI_UserGuidesFAQ.pdf
+# Planet basemap tile URLs are made of a mosaic prefix, the mosaic date, a suffix and the
+# API key. Everything but the API key is assembled once into the "bases" below, which
+# are kept as (mosaic date, base) pairs so that layer names need not be parsed from URLs.
+_PLANET_TILES_URL = "https://tiles.planet.com/basemaps/v1/planet-tiles/"
+_PLANET_TILES_SUFFIX = "_mosaic/gmap/{z}/{x}/{y}.png?api_key="
+_PLANET_TROPICAL_PREFIX = _PLANET_TILES_URL + "planet_medres_normalized_analytic_"
+_PLANET_MONTHLY_PREFIX = _PLANET_TILES_URL + "global_monthly_"
+_PLANET_QUARTERLY_PREFIX = _PLANET_TILES_URL + "global_quarterly_"
+_PLANET_BIANNUAL_TROPICAL_BASES = tuple(
+    (d, _PLANET_TROPICAL_PREFIX + d + _PLANET_TILES_SUFFIX)
+    for d in (
+        "2015-12_2016-05",
+        "2016-06_2016-11",
+        "2016-12_2017-05",
+        "2017-06_2017-11",
+        "2017-12_2018-05",
+        "2018-06_2018-11",
+        "2018-12_2019-05",
+        "2019-06_2019-11",
+        "2019-12_2020-05",
+        "2020-06_2020-08",
+    )
+)
+
+
+def _planet_api_key(api_key=None, token_name="PLANET_API_KEY"):
+    """Returns the Planet API key, looking it up from an environment variable if needed.
 
     Args:
         api_key (str, optional): The Planet API key. Defaults to None.
@@ -1831,36 +2433,70 @@ def planet_monthly_tropical(api_key=None, token_name="PLANET_API_KEY"):
         ValueError: If the API key could not be found.
 
     Returns:
-        list: A list of tile URLs.
+        str: The Planet API key.
     """
-    from datetime import date
-
     if api_key is None:
         api_key = os.environ.get(token_name)
         if api_key is None:
             raise ValueError("The Planet API Key must be provided.")
+    return api_key
+
+
+def planet_monthly_tropical(api_key=None, token_name="PLANET_API_KEY"):
+    """Generates Planet monthly imagery URLs based on an API key. See https://assets.planet.com/docs/NICFI_UserGuidesFAQ.pdf
+
+    Args:
+        api_key (str, optional): The Planet API key. Defaults to None.
+        token_name (str, optional): The environment variable name of the API key. Defaults to "PLANET_API_KEY".
 
+    Raises:
+        ValueError: If the API key could not be found.
+
+    Returns:
+        list: A list of tile URLs.
+    """
+    api_key = _planet_api_key(api_key, token_name)
     today = date.today()
-    year_now = int(today.strftime("%Y"))
-    month_now = int(today.strftime("%m"))
+    links = _planet_monthly_tropical_links(api_key, today.year, today.month)
+    return [url for _, url in links]
 
-    links = []
-    prefix = "https://tiles.planet.com/basemaps/v1/planet-tiles/planet_medres_normalized_analytic_"
-    subfix = "_mosaic/gmap/{z}/{x}/{y}.png?api_key="
 
-    for year in range(2020, year_now + 1):
-        for month in range(1, 13):
-            m_str = str(year) + "-" + str(month).zfill(2)
+@functools.lru_cache(maxsize=32)
+def _planet_monthly_tropical_links(api_key, year_now, month_now):
+    """Generates the Planet monthly tropical imagery URLs, cached per API key and month.
 
-            if year == 2020 and month < 9:
-                continue
-            if year == year_now and month >= month_now:
-                break
+    Args:
+        api_key (str): The Planet API key.
+        year_now (int): The current year.
+        month_now (int): The current month.
+
+    Returns:
+        tuple: A tuple of (mosaic date, tile URL) pairs.
+    """
+    bases = _planet_monthly_tropical_bases(year_now, month_now)
+    return tuple([(tag, base + api_key) for tag, base in bases])
 
-            url = f"{prefix}{m_str}{subfix}{api_key}"
-            links.append(url)
 
-    return links
+@functools.lru_cache(maxsize=8)
+def _planet_monthly_tropical_bases(year_now, month_now):
+    """Generates the Planet monthly tropical imagery URLs without the API key.
+
+    Args:
+        year_now (int): The current year.
+        month_now (int): The current month.
+
+    Returns:
+        tuple: A tuple of (mosaic date, tile URL missing the trailing API key) pairs.
+    """
+    # Monthly mosaics are available from September 2020 up to the previous month,
+    # i.e., month indices (year * 12 + month - 1) from 2020 * 12 + 8 up to now.
+    tags = [
+        f"{n // 12}-{n % 12 + 1:02d}"
+        for n in range(2020 * 12 + 8, year_now * 12 + month_now - 1)
+    ]
+    return tuple(
+        (tag, _PLANET_TROPICAL_PREFIX + tag + _PLANET_TILES_SUFFIX) for tag in tags
+    )
 
 
 def planet_biannual_tropical(api_key=None, token_name="PLANET_API_KEY"):
@@ -1877,33 +2513,23 @@ def planet_biannual_tropical(api_key=None, token_name="PLANET_API_KEY"):
         list: A list of tile URLs.
     """
 
-    if api_key is None:
-        api_key = os.environ.get(token_name)
-        if api_key is None:
-            raise ValueError("The Planet API Key must be provided.")
+    links = _planet_biannual_tropical_links(_planet_api_key(api_key, token_name))
+    return [url for _, url in links]
 
-    dates = [
-        "2015-12_2016-05",
-        "2016-06_2016-11",
-        "2016-12_2017-05",
-        "2017-06_2017-11",
-        "2017-12_2018-05",
-        "2018-06_2018-11",
-        "2018-12_2019-05",
-        "2019-06_2019-11",
-        "2019-12_2020-05",
-        "2020-06_2020-08",
-    ]
 
-    link = []
-    prefix = "https://tiles.planet.com/basemaps/v1/planet-tiles/planet_medres_normalized_analytic_"
-    subfix = "_mosaic/gmap/{z}/{x}/{y}.png?api_key="
+@functools.lru_cache(maxsize=32)
+def _planet_biannual_tropical_links(api_key):
+    """Generates the Planet bi-annual tropical imagery URLs, cached per API key.
 
-    for d in dates:
-        url = f"{prefix}{d}{subfix}{api_key}"
-        link.append(url)
+    Args:
+        api_key (str): The Planet API key.
 
-    return link
+    Returns:
+        tuple: A tuple of (mosaic date, tile URL) pairs.
+    """
+    return tuple(
+        [(tag, base + api_key) for tag, base in _PLANET_BIANNUAL_TROPICAL_BASES]
+    )
 
 
 def planet_catalog_tropical(api_key=None, token_name="PLANET_API_KEY"):
@@ -1916,9 +2542,66 @@ def planet_catalog_tropical(api_key=None, token_name="PLANET_API_KEY"):
     Returns:
         list: A list of tile URLs.
     """
-    biannual = planet_biannual_tropical(api_key, token_name)
-    monthly = planet_monthly_tropical(api_key, token_name)
-    return biannual + monthly
+    api_key = _planet_api_key(api_key, token_name)
+    return [
+        *planet_biannual_tropical(api_key),
+        *planet_monthly_tropical(api_key),
+    ]
+
+
+def _planet_ipyleaflet_tile(url, name):
+    """Creates an ipyleaflet TileLayer for a Planet basemap.
+
+    Args:
+        url (str): The tile URL.
+        name (str): The layer name.
+
+    Returns:
+        ipyleaflet.TileLayer: The tile layer.
+    """
+    return ipyleaflet.TileLayer(url=url, attribution="Planet", name=name)
+
+
+def _planet_folium_tile(url, name):
+    """Creates a folium TileLayer for a Planet basemap.
+
+    Args:
+        url (str): The tile URL.
+        name (str): The layer name.
+
+    Returns:
+        folium.TileLayer: The tile layer.
+    """
+    return folium.TileLayer(
+        tiles=url,
+        attr="Planet",
+        name=name,
+        overlay=True,
+        control=True,
+    )
+
+
+# The Planet TileLayer constructors keyed by tile format.
+_PLANET_TILE_MAKERS = {
+    "ipyleaflet": _planet_ipyleaflet_tile,
+    "folium": _planet_folium_tile,
+}
+
+
+def _iter_planet_tiles(links, tile_format="ipyleaflet"):
+    """Lazily creates Planet TileLayers from (mosaic date, URL) pairs.
+
+    Args:
+        links (iterable): (mosaic date, tile URL) pairs.
+        tile_format (str, optional): The TileLayer format, can be either ipyleaflet or folium. Defaults to "ipyleaflet".
+
+    Yields:
+        tuple: The layer name and the TileLayer.
+    """
+    make_tile = _PLANET_TILE_MAKERS[tile_format]
+    for tag, url in links:
+        name = "Planet_" + tag
+        yield name, make_tile(url, name)
 
 
 def planet_monthly_tiles_tropical(
@@ -1941,26 +2624,10 @@ def planet_monthly_tiles_tropical(
     if tile_format not in ["ipyleaflet", "folium"]:
         raise ValueError("The tile format must be either ipyleaflet or folium.")
 
-    tiles = {}
-    link = planet_monthly_tropical(api_key, token_name)
-    for url in link:
-        index = url.find("20")
-        name = "Planet_" + url[index : index + 7]
-
-        if tile_format == "ipyleaflet":
-            tile = ipyleaflet.TileLayer(url=url, attribution="Planet", name=name)
-        else:
-            tile = folium.TileLayer(
-                tiles=url,
-                attr="Planet",
-                name=name,
-                overlay=True,
-                control=True,
-            )
-
-        tiles[name] = tile
-
-    return tiles
+    api_key = _planet_api_key(api_key, token_name)
+    today = date.today()
+    links = _planet_monthly_tropical_links(api_key, today.year, today.month)
+    return dict(_iter_planet_tiles(links, tile_format))
 
 
 def planet_biannual_tiles_tropical(
@@ -1983,24 +2650,9 @@ def planet_biannual_tiles_tropical(
     if tile_format not in ["ipyleaflet", "folium"]:
         raise ValueError("The tile format must be either ipyleaflet or folium.")
 
-    tiles = {}
-    link = planet_biannual_tropical(api_key, token_name)
-    for url in link:
-        index = url.find("20")
-        name = "Planet_" + url[index : index + 15]
-        if tile_format == "ipyleaflet":
-            tile = ipyleaflet.TileLayer(url=url, attribution="Planet", name=name)
-        else:
-            tile = folium.TileLayer(
-                tiles=url,
-                attr="Planet",
-                name=name,
-                overlay=True,
-                control=True,
-            )
-        tiles[name] = tile
-
-    return tiles
+    api_key = _planet_api_key(api_key, token_name)
+    links = _planet_biannual_tropical_links(api_key)
+    return dict(_iter_planet_tiles(links, tile_format))
 
 
 def planet_tiles_tropical(
@@ -2020,17 +2672,16 @@ def planet_tiles_tropical(
         dict: A dictionary of TileLayer.
     """
 
-    catalog = {}
-    biannul = planet_biannual_tiles_tropical(api_key, token_name, tile_format)
-    monthly = planet_monthly_tiles_tropical(api_key, token_name, tile_format)
-
-    for key in biannul:
-        catalog[key] = biannul[key]
-
-    for key in monthly:
-        catalog[key] = monthly[key]
+    if tile_format not in ["ipyleaflet", "folium"]:
+        raise ValueError("The tile format must be either ipyleaflet or folium.")
 
-    return catalog
+    api_key = _planet_api_key(api_key, token_name)
+    today = date.today()
+    links = itertools.chain(
+        _planet_biannual_tropical_links(api_key),
+        _planet_monthly_tropical_links(api_key, today.year, today.month),
+    )
+    return dict(_iter_planet_tiles(links, tile_format))
 
 
 def planet_monthly(api_key=None, token_name="PLANET_API_KEY"):
@@ -2046,32 +2697,45 @@ def planet_monthly(api_key=None, token_name="PLANET_API_KEY"):
     Returns:
         list: A list of tile URLs.
     """
-    from datetime import date
+    api_key = _planet_api_key(api_key, token_name)
+    today = date.today()
+    links = _planet_monthly_links(api_key, today.year, today.month)
+    return [url for _, url in links]
 
-    if api_key is None:
-        api_key = os.environ.get(token_name)
-        if api_key is None:
-            raise ValueError("The Planet API Key must be provided.")
 
-    today = date.today()
-    year_now = int(today.strftime("%Y"))
-    month_now = int(today.strftime("%m"))
+@functools.lru_cache(maxsize=32)
+def _planet_monthly_links(api_key, year_now, month_now):
+    """Generates the Planet monthly imagery URLs, cached per API key and month.
 
-    link = []
-    prefix = "https://tiles.planet.com/basemaps/v1/planet-tiles/global_monthly_"
-    subfix = "_mosaic/gmap/{z}/{x}/{y}.png?api_key="
+    Args:
+        api_key (str): The Planet API key.
+        year_now (int): The current year.
+        month_now (int): The current month.
 
-    for year in range(2016, year_now + 1):
-        for month in range(1, 13):
-            m_str = str(year) + "_" + str(month).zfill(2)
+    Returns:
+        tuple: A tuple of (mosaic date, tile URL) pairs.
+    """
+    bases = _planet_monthly_bases(year_now, month_now)
+    return tuple([(tag, base + api_key) for tag, base in bases])
 
-            if year == year_now and month >= month_now:
-                break
 
-            url = f"{prefix}{m_str}{subfix}{api_key}"
-            link.append(url)
+@functools.lru_cache(maxsize=8)
+def _planet_monthly_bases(year_now, month_now):
+    """Generates the Planet monthly imagery URLs without the API key.
 
-    return link
+    Args:
+        year_now (int): The current year.
+        month_now (int): The current month.
+
+    Returns:
+        tuple: A tuple of (mosaic date, tile URL missing the trailing API key) pairs.
+    """
+    # Monthly mosaics are available from January 2016 up to the previous month.
+    total = (year_now - 2016) * 12 + month_now - 1
+    tags = [f"{2016 + n // 12}_{n % 12 + 1:02d}" for n in range(total)]
+    return tuple(
+        (tag, _PLANET_MONTHLY_PREFIX + tag + _PLANET_TILES_SUFFIX) for tag in tags
+    )
 
 
 def planet_quarterly(api_key=None, token_name="PLANET_API_KEY"):
@@ -2087,33 +2751,45 @@ def planet_quarterly(api_key=None, token_name="PLANET_API_KEY"):
     Returns:
         list: A list of tile URLs.
     """
-    from datetime import date
+    api_key = _planet_api_key(api_key, token_name)
+    today = date.today()
+    links = _planet_quarterly_links(api_key, today.year, (today.month - 1) // 3 + 1)
+    return [url for _, url in links]
 
-    if api_key is None:
-        api_key = os.environ.get(token_name)
-        if api_key is None:
-            raise ValueError("The Planet API Key must be provided.")
 
-    today = date.today()
-    year_now = int(today.strftime("%Y"))
-    month_now = int(today.strftime("%m"))
-    quarter_now = (month_now - 1) // 3 + 1
+@functools.lru_cache(maxsize=32)
+def _planet_quarterly_links(api_key, year_now, quarter_now):
+    """Generates the Planet quarterly imagery URLs, cached per API key and quarter.
 
-    link = []
-    prefix = "https://tiles.planet.com/basemaps/v1/planet-tiles/global_quarterly_"
-    subfix = "_mosaic/gmap/{z}/{x}/{y}.png?api_key="
+    Args:
+        api_key (str): The Planet API key.
+        year_now (int): The current year.
+        quarter_now (int): The current quarter.
 
-    for year in range(2016, year_now + 1):
-        for quarter in range(1, 5):
-            m_str = str(year) + "q" + str(quarter)
+    Returns:
+        tuple: A tuple of (mosaic date, tile URL) pairs.
+    """
+    bases = _planet_quarterly_bases(year_now, quarter_now)
+    return tuple([(tag, base + api_key) for tag, base in bases])
 
-            if year == year_now and quarter >= quarter_now:
-                break
 
-            url = f"{prefix}{m_str}{subfix}{api_key}"
-            link.append(url)
+@functools.lru_cache(maxsize=8)
+def _planet_quarterly_bases(year_now, quarter_now):
+    """Generates the Planet quarterly imagery URLs without the API key.
 
-    return link
+    Args:
+        year_now (int): The current year.
+        quarter_now (int): The current quarter.
+
+    Returns:
+        tuple: A tuple of (mosaic date, tile URL missing the trailing API key) pairs.
+    """
+    # Quarterly mosaics are available from 2016q1 up to the previous quarter.
+    total = (year_now - 2016) * 4 + quarter_now - 1
+    tags = [f"{2016 + n // 4}q{n % 4 + 1}" for n in range(total)]
+    return tuple(
+        (tag, _PLANET_QUARTERLY_PREFIX + tag + _PLANET_TILES_SUFFIX) for tag in tags
+    )
 
 
 def planet_catalog(api_key=None, token_name="PLANET_API_KEY"):
@@ -2126,9 +2802,11 @@ def planet_catalog(api_key=None, token_name="PLANET_API_KEY"):
     Returns:
         list: A list of tile URLs.
     """
-    quarterly = planet_quarterly(api_key, token_name)
-    monthly = planet_monthly(api_key, token_name)
-    return quarterly + monthly
+    api_key = _planet_api_key(api_key, token_name)
+    return [
+        *planet_quarterly(api_key),
+        *planet_monthly(api_key),
+    ]
 
 
 def planet_monthly_tiles(
@@ -2151,27 +2829,10 @@ def planet_monthly_tiles(
     if tile_format not in ["ipyleaflet", "folium"]:
         raise ValueError("The tile format must be either ipyleaflet or folium.")
 
-    tiles = {}
-    link = planet_monthly(api_key, token_name)
-
-    for url in link:
-        index = url.find("20")
-        name = "Planet_" + url[index : index + 7]
-
-        if tile_format == "ipyleaflet":
-            tile = ipyleaflet.TileLayer(url=url, attribution="Planet", name=name)
-        else:
-            tile = folium.TileLayer(
-                tiles=url,
-                attr="Planet",
-                name=name,
-                overlay=True,
-                control=True,
-            )
-
-        tiles[name] = tile
-
-    return tiles
+    api_key = _planet_api_key(api_key, token_name)
+    today = date.today()
+    links = _planet_monthly_links(api_key, today.year, today.month)
+    return dict(_iter_planet_tiles(links, tile_format))
 
 
 def planet_quarterly_tiles(
@@ -2194,27 +2855,10 @@ def planet_quarterly_tiles(
     if tile_format not in ["ipyleaflet", "folium"]:
         raise ValueError("The tile format must be either ipyleaflet or folium.")
 
-    tiles = {}
-    links = planet_quarterly(api_key, token_name)
-
-    for url in links:
-        index = url.find("20")
-        name = "Planet_" + url[index : index + 6]
-
-        if tile_format == "ipyleaflet":
-            tile = ipyleaflet.TileLayer(url=url, attribution="Planet", name=name)
-        else:
-            tile = folium.TileLayer(
-                tiles=url,
-                attr="Planet",
-                name=name,
-                overlay=True,
-                control=True,
-            )
-
-        tiles[name] = tile
-
-    return tiles
+    api_key = _planet_api_key(api_key, token_name)
+    today = date.today()
+    links = _planet_quarterly_links(api_key, today.year, (today.month - 1) // 3 + 1)
+    return dict(_iter_planet_tiles(links, tile_format))
 
 
 def planet_tiles(api_key=None, token_name="PLANET_API_KEY", tile_format="ipyleaflet"):
@@ -2232,17 +2876,16 @@ def planet_tiles(api_key=None, token_name="PLANET_API_KEY", tile_format="ipyleaf
         dict: A dictionary of TileLayer.
     """
 
-    catalog = {}
-    quarterly = planet_quarterly_tiles(api_key, token_name, tile_format)
-    monthly = planet_monthly_tiles(api_key, token_name, tile_format)
+    if tile_format not in ["ipyleaflet", "folium"]:
+        raise ValueError("The tile format must be either ipyleaflet or folium.")
 
-    for key in quarterly:
-        catalog[key] = quarterly[key]
-
-    for key in monthly:
-        catalog[key] = monthly[key]
-
-    return catalog
+    api_key = _planet_api_key(api_key, token_name)
+    today = date.today()
+    links = itertools.chain(
+        _planet_quarterly_links(api_key, today.year, (today.month - 1) // 3 + 1),
+        _planet_monthly_links(api_key, today.year, today.month),
+    )
+    return dict(_iter_planet_tiles(links, tile_format))
 
 
 def planet_by_quarter(
@@ -2268,16 +2911,10 @@ def planet_by_quarter(
     Returns:
         str: A Planet global mosaic tile url.
     """
-    from datetime import date
-
-    if api_key is None:
-        api_key = os.environ.get(token_name)
-        if api_key is None:
-            raise ValueError("The Planet API Key must be provided.")
-
+    api_key = _planet_api_key(api_key, token_name)
     today = date.today()
-    year_now = int(today.strftime("%Y"))
-    month_now = int(today.strftime("%m"))
+    year_now = today.year
+    month_now = today.month
     quarter_now = (month_now - 1) // 3 + 1
 
     if year > year_now:
@@ -2288,13 +2925,7 @@ def planet_by_quarter(
     if quarter < 1 or quarter > 4:
         raise ValueError("Quarter must be between 1 and 4.")
 
-    prefix = "https://tiles.planet.com/basemaps/v1/planet-tiles/global_quarterly_"
-    subfix = "_mosaic/gmap/{z}/{x}/{y}.png?api_key="
-
-    m_str = str(year) + "q" + str(quarter)
-    url = f"{prefix}{m_str}{subfix}{api_key}"
-
-    return url
+    return f"{_PLANET_QUARTERLY_PREFIX}{year}q{quarter}{_PLANET_TILES_SUFFIX}{api_key}"
 
 
 def planet_by_month(
@@ -2320,16 +2951,10 @@ def planet_by_month(
     Returns:
         str: A Planet global mosaic tile url.
     """
-    from datetime import date
-
-    if api_key is None:
-        api_key = os.environ.get(token_name)
-        if api_key is None:
-            raise ValueError("The Planet API Key must be provided.")
-
+    api_key = _planet_api_key(api_key, token_name)
     today = date.today()
-    year_now = int(today.strftime("%Y"))
-    month_now = int(today.strftime("%m"))
+    year_now = today.year
+    month_now = today.month
     # quarter_now = (month_now - 1) // 3 + 1
 
     if year > year_now:
@@ -2340,13 +2965,7 @@ def planet_by_month(
     if month < 1 or month > 12:
         raise ValueError("Month must be between 1 and 12.")
 
-    prefix = "https://tiles.planet.com/basemaps/v1/planet-tiles/global_monthly_"
-    subfix = "_mosaic/gmap/{z}/{x}/{y}.png?api_key="
-
-    m_str = str(year) + "_" + str(month).zfill(2)
-    url = f"{prefix}{m_str}{subfix}{api_key}"
-
-    return url
+    return f"{_PLANET_MONTHLY_PREFIX}{year}_{month:02d}{_PLANET_TILES_SUFFIX}{api_key}"
 
 
 def planet_tile_by_quarter(
@@ -2382,18 +3001,7 @@ def planet_tile_by_quarter(
     if name is None:
         name = "Planet_" + str(year) + "_q" + str(quarter)
 
-    if tile_format == "ipyleaflet":
-        tile = ipyleaflet.TileLayer(url=url, attribution="Planet", name=name)
-    else:
-        tile = folium.TileLayer(
-            tiles=url,
-            attr="Planet",
-            name=name,
-            overlay=True,
-            control=True,
-        )
-
-    return tile
+    return _PLANET_TILE_MAKERS[tile_format](url, name)
 
 
 def planet_tile_by_month(
@@ -2429,18 +3037,7 @@ def planet_tile_by_month(
     if name is None:
         name = "Planet_" + str(year) + "_" + str(month).zfill(2)
 
-    if tile_format == "ipyleaflet":
-        tile = ipyleaflet.TileLayer(url=url, attribution="Planet", name=name)
-    else:
-        tile = folium.TileLayer(
-            tiles=url,
-            attr="Planet",
-            name=name,
-            overlay=True,
-            control=True,
-        )
-
-    return tile
+    return _PLANET_TILE_MAKERS[tile_format](url, name)
 
 
 def basemap_xyz_tiles():
@@ -2451,14 +3048,11 @@ def basemap_xyz_tiles():
     """
     from .leafmap import basemaps
 
-    layers_dict = {}
-    keys = dict(basemaps).keys()
-    for key in keys:
-        if isinstance(basemaps[key], ipyleaflet.WMSLayer):
-            pass
-        else:
-            layers_dict[key] = basemaps[key]
-    return layers_dict
+    return {
+        key: layer
+        for key, layer in basemaps.items()
+        if not isinstance(layer, ipyleaflet.WMSLayer)
+    }
 
 
 def to_hex_colors(colors):
@@ -2470,13 +3064,33 @@ def to_hex_colors(colors):
     Returns:
         list: A list of hex color codes prefixed with #.
     """
-    result = all([len(color.strip()) == 6 for color in colors])
-    if result:
-        return ["#" + color.strip() for color in colors]
+    stripped = [color.strip() for color in colors]
+    if all(len(color) == 6 for color in stripped):
+        return ["#" + color for color in stripped]
     else:
         return colors
 
 
+@functools.lru_cache(maxsize=1)
+def _load_census_dict(census_data):
+    """Loads the Census data JSON file, parsing it only once per session.
+
+    Args:
+        census_data (str): The path to the Census data JSON file.
+
+    Returns:
+        dict: A dictionary of Census data.
+    """
+    try:
+        import orjson
+    except ImportError:
+        with open(census_data, "r") as f:
+            return json.load(f)
+
+    with open(census_data, "rb") as f:
+        return orjson.loads(f.read())
+
+
 def get_census_dict(reset=False):
     """Returns a dictionary of Census data.
 
@@ -2484,20 +3098,26 @@ def get_census_dict(reset=False):
         reset (bool, optional): Reset the dictionary. Defaults to False.
 
     Returns:
-        dict: A dictionary of Census data.
+        dict: A dictionary of Census data. Unless reset is True, the same dictionary
+            is returned on every call, so copy it before modifying it.
     """
-    import json
     import importlib.resources
 
     pkg_dir = os.path.dirname(importlib.resources.files("leafmap") / "leafmap.py")
     census_data = os.path.join(pkg_dir, "data/census_data.json")
 
     if reset:
+        from concurrent.futures import ThreadPoolExecutor
+
         try:
             from owslib.wms import WebMapService
         except ImportError:
             raise ImportError("Please install owslib using 'pip install owslib'.")
 
+        def get_layers(url):
+            wms = WebMapService(url, timeout=300)
+            return sorted(wms.contents)
+
         census_dict = {}
 
         names = [
@@ -2534,9 +3154,11 @@ def get_census_dict(reset=False):
                     f"https://tigerweb.geo.census.gov/arcgis/services/Census2020/tigerWMS_{name.replace('Decennial', '').replace(' ', '')}/MapServer/WMSServer"
                 )
 
-            wms = WebMapService(links[name], timeout=300)
-            layers = list(wms.contents)
-            layers.sort()
+        # The WMS capabilities requests are independent, so issue them concurrently.
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            all_layers = list(executor.map(get_layers, links.values()))
+
+        for name, layers in zip(links, all_layers):
             census_dict[name] = {
                 "url": links[name],
                 "layers": layers,
@@ -2546,14 +3168,33 @@ def get_census_dict(reset=False):
 
         with open(census_data, "w") as f:
             json.dump(census_dict, f, indent=4)
+        _load_census_dict.cache_clear()
 
     else:
-        with open(census_data, "r") as f:
-            census_dict = json.load(f)
+        census_dict = _load_census_dict(census_data)
 
     return census_dict
 
 
+@functools.lru_cache(maxsize=256)
+def _xyz_filter(keyword, name=None):
+    """Filters the xyzservices providers, caching the result since the providers are static.
+
+    Args:
+        keyword (str): The keyword to search for.
+        name (str, optional): The name of the xyz tile. Defaults to None.
+
+    Returns:
+        dict: A flat dictionary of the matching TileProvider objects.
+    """
+    import xyzservices.providers as xyz
+
+    if name is None:
+        return xyz.filter(keyword=keyword).flatten()
+    else:
+        return xyz.filter(name=name).flatten()
+
+
 def search_xyz_services(keyword, name=None, list_only=True, add_prefix=True):
     """Search for XYZ tile providers from xyzservices.
 
@@ -2567,20 +3208,15 @@ def search_xyz_services(keyword, name=None, list_only=True, add_prefix=True):
         list: A list of XYZ tile providers.
     """
 
-    import xyzservices.providers as xyz
-
-    if name is None:
-        providers = xyz.filter(keyword=keyword).flatten()
-    else:
-        providers = xyz.filter(name=name).flatten()
+    providers = _xyz_filter(keyword, name)
 
     if list_only:
         if add_prefix:
             return ["xyz." + provider for provider in providers]
         else:
-            return [provider for provider in providers]
+            return list(providers)
     else:
-        return providers
+        return dict(providers)
 
 
 def search_qms(keyword, limit=10, list_only=True, add_prefix=True):
@@ -2597,8 +3233,8 @@ def search_qms(keyword, limit=10, list_only=True, add_prefix=True):
     """
 
     QMS_API = "https://qms.nextgis.com/api/v1/geoservices"
-    services = requests.get(
-        f"{QMS_API}/?search={keyword}&type=tms&epsg=3857&limit={limit}"
+    services = _SESSION.get(
+        f"{QMS_API}/?search={keyword}&type=tms&epsg=3857&limit={limit}", timeout=30
     )
     services = services.json()
     if services["results"]:
@@ -2669,16 +3305,31 @@ def read_file_from_url(url, return_type="list", encoding="utf-8"):
     Returns:
         str | list: The contents of the file.
     """
+    import io
     from urllib.request import urlopen
 
     if return_type == "list":
-        return [line.decode(encoding).rstrip() for line in urlopen(url).readlines()]
+        with urlopen(url) as response:
+            # Decode the lines as they are read instead of buffering a list of bytes.
+            lines = io.TextIOWrapper(response, encoding=encoding, newline="\n")
+            return [line.rstrip() for line in lines]
     elif return_type == "string":
-        return urlopen(url).read().decode(encoding)
+        with urlopen(url) as response:
+            return response.read().decode(encoding)
     else:
         raise ValueError("The return type must be either list or string.")
 
 
+# MIME types of the files that st_download_button() recognizes by extension.
+_DOWNLOAD_MIME_TYPES = {
+    ".csv": "text/csv",
+    ".gif": "image/gif",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+}
+
+
 def st_download_button(
     label,
     data,
@@ -2716,19 +3367,21 @@ def st_download_button(
             if file_name is None:
                 file_name = data.split("/")[-1]
 
-            if data.endswith(".csv"):
-                data = pd.read_csv(data).to_csv(sep=csv_sep, index=False)
-                if mime is None:
-                    mime = "text/csv"
+            ext = os.path.splitext(data)[1].lower()
+            if mime is None:
+                mime = _DOWNLOAD_MIME_TYPES.get(ext, "application/octet-stream")
+
+            if ext == ".csv":
+                if csv_sep == "," and os.path.isfile(data):
+                    # The file is already in the requested format; send it as is.
+                    with open(data, "rb") as f:
+                        data = f.read()
+                else:
+                    data = pd.read_csv(data).to_csv(sep=csv_sep, index=False)
                 return st.download_button(
                     label, data, file_name, mime, key, help, on_click, args, **kwargs
                 )
-            elif (
-                data.endswith(".gif") or data.endswith(".png") or data.endswith(".jpg")
-            ):
-                if mime is None:
-                    mime = f"image/{os.path.splitext(data)[1][1:]}"
-
+            elif ext in _DOWNLOAD_MIME_TYPES or os.path.isfile(data):
                 with open(data, "rb") as file:
                     return st.download_button(
                         label,
@@ -2785,9 +3438,6 @@ def save_data(data, file_ext=None, file_name=None):
     Returns:
         str: The path of the file.
     """
-    import tempfile
-    import uuid
-
     try:
         if file_ext is None:
             if hasattr(data, "name"):
@@ -2801,11 +3451,19 @@ def save_data(data, file_ext=None, file_name=None):
             if not file_path.endswith(file_ext):
                 file_path = file_path + file_ext
         else:
-            file_id = str(uuid.uuid4())
-            file_path = os.path.join(tempfile.gettempdir(), f"{file_id}{file_ext}")
+            file_path = os.path.join(
+                tempfile.gettempdir(), f"{uuid.uuid4().hex}{file_ext}"
+            )
 
+        chunk_size = 1 << 20
         with open(file_path, "wb") as file:
-            file.write(data.getbuffer())
+            if hasattr(data, "getbuffer"):
+                with data.getbuffer() as buffer:
+                    for start in range(0, len(buffer), chunk_size):
+                        file.write(buffer[start : start + chunk_size])
+            else:
+                data.seek(0)
+                shutil.copyfileobj(data, file, length=chunk_size)
         return file_path
     except Exception as e:
         print(e)
@@ -2822,17 +3480,98 @@ def temp_file_path(extension):
         str: The temporary file path.
     """
 
-    import tempfile
-    import uuid
-
     if not extension.startswith("."):
         extension = "." + extension
-    file_id = str(uuid.uuid4())
-    file_path = os.path.join(tempfile.gettempdir(), f"{file_id}{extension}")
+    file_path = os.path.join(tempfile.gettempdir(), f"{uuid.uuid4().hex}{extension}")
 
     return file_path
 
 
+_LOCAL_TILE_DEPRECATED_KWARGS = {
+    "cmap": "colormap",
+    "palette": "colormap",
+    "band": "indexes",
+    "bands": "indexes",
+}
+_LOCAL_TILE_IGNORED_KWARGS = ("projection", "style")
+
+
+def _normalize_local_tile_args(source, colormap, indexes, nodata, client_args, kwargs):
+    """Normalizes the arguments shared by get_local_tile_layer() and get_local_tile_url().
+
+    Args:
+        source (str | TileClient | rasterio.io.DatasetReader): The raster source.
+        colormap (str): The name of the colormap.
+        indexes (int): The band(s) to use.
+        nodata (float): The nodata value.
+        client_args (dict): Additional arguments to pass to the TileClient.
+        kwargs (dict): The remaining keyword arguments, updated in place.
+
+    Raises:
+        ValueError: If the source is not a string, TileClient or rasterio dataset.
+
+    Returns:
+        tuple: The source, colormap, indexes, nodata and kwargs.
+    """
+    import rasterio
+    from localtileserver import TileClient
+
+    # Handle legacy localtileserver kwargs. Most calls pass none of them.
+    if not kwargs.keys().isdisjoint(_LOCAL_TILE_DEPRECATED_KWARGS):
+        for key, replacement in _LOCAL_TILE_DEPRECATED_KWARGS.items():
+            if key in kwargs:
+                warnings.warn(
+                    f"`{key}` is a deprecated keyword argument for get_local_tile_layer. Please use `{replacement}`."
+                )
+                if replacement == "colormap":
+                    colormap = kwargs.pop(key)
+                else:
+                    indexes = kwargs.pop(key)
+    if not kwargs.keys().isdisjoint(_LOCAL_TILE_IGNORED_KWARGS):
+        for key in _LOCAL_TILE_IGNORED_KWARGS:
+            if key in kwargs:
+                warnings.warn(
+                    f"`{key}` is a deprecated keyword argument for get_local_tile_layer and will be ignored."
+                )
+
+    kwargs.setdefault("max_zoom", 30)
+    kwargs.setdefault("max_native_zoom", 30)
+    kwargs.update(client_args)
+
+    # Make it compatible with binder and JupyterHub
+    if os.environ.get("JUPYTERHUB_SERVICE_PREFIX") is not None:
+        os.environ["LOCALTILESERVER_CLIENT_PREFIX"] = (
+            f"{os.environ['JUPYTERHUB_SERVICE_PREFIX'].lstrip('/')}/proxy/{{port}}"
+        )
+
+    if is_studio_lab():
+        os.environ["LOCALTILESERVER_CLIENT_PREFIX"] = (
+            f"studiolab/default/jupyter/proxy/{{port}}"
+        )
+    elif is_on_aws():
+        os.environ["LOCALTILESERVER_CLIENT_PREFIX"] = "proxy/{port}"
+    elif "prefix" in kwargs:
+        os.environ["LOCALTILESERVER_CLIENT_PREFIX"] = kwargs.pop("prefix")
+
+    if isinstance(source, str):
+        if source.startswith("http"):
+            source = github_raw_url(source)
+        elif source.startswith("~"):
+            source = os.path.expanduser(source)
+    elif not isinstance(source, (TileClient, rasterio.io.DatasetReader)):
+        raise ValueError("The source must either be a string or TileClient")
+
+    if nodata is None:
+        nodata = get_api_key("NODATA")
+        if isinstance(nodata, str):
+            nodata = float(nodata)
+
+    if isinstance(colormap, str):
+        colormap = colormap.lower()
+
+    return source, colormap, indexes, nodata, kwargs
+
+
 def get_local_tile_layer(
     source,
     port="default",
@@ -2876,109 +3615,26 @@ def get_local_tile_layer(
     Returns:
         ipyleaflet.TileLayer | folium.TileLayer: An ipyleaflet.TileLayer or folium.TileLayer.
     """
-    import rasterio
-
     check_package(
         "localtileserver", URL="https://github.com/banesullivan/localtileserver"
     )
-
-    # Handle legacy localtileserver kwargs
-    if "cmap" in kwargs:
-        warnings.warn(
-            "`cmap` is a deprecated keyword argument for get_local_tile_layer. Please use `colormap`."
-        )
-    if "palette" in kwargs:
-        warnings.warn(
-            "`palette` is a deprecated keyword argument for get_local_tile_layer. Please use `colormap`."
-        )
-    if "band" in kwargs or "bands" in kwargs:
-        warnings.warn(
-            "`band` and `bands` are deprecated keyword arguments for get_local_tile_layer. Please use `indexes`."
-        )
-    if "projection" in kwargs:
-        warnings.warn(
-            "`projection` is a deprecated keyword argument for get_local_tile_layer and will be ignored."
-        )
-    if "style" in kwargs:
-        warnings.warn(
-            "`style` is a deprecated keyword argument for get_local_tile_layer and will be ignored."
-        )
-
-    if "max_zoom" not in kwargs:
-        kwargs["max_zoom"] = 30
-    if "max_native_zoom" not in kwargs:
-        kwargs["max_native_zoom"] = 30
-    if "cmap" in kwargs:
-        colormap = kwargs.pop("cmap")
-    if "palette" in kwargs:
-        colormap = kwargs.pop("palette")
-    if "band" in kwargs:
-        indexes = kwargs.pop("band")
-    if "bands" in kwargs:
-        indexes = kwargs.pop("bands")
-
-    for key in client_args:
-        kwargs[key] = client_args[key]
-
-    # Make it compatible with binder and JupyterHub
-    if os.environ.get("JUPYTERHUB_SERVICE_PREFIX") is not None:
-        os.environ["LOCALTILESERVER_CLIENT_PREFIX"] = (
-            f"{os.environ['JUPYTERHUB_SERVICE_PREFIX'].lstrip('/')}/proxy/{{port}}"
-        )
-
-    if is_studio_lab():
-        os.environ["LOCALTILESERVER_CLIENT_PREFIX"] = (
-            f"studiolab/default/jupyter/proxy/{{port}}"
-        )
-    elif is_on_aws():
-        os.environ["LOCALTILESERVER_CLIENT_PREFIX"] = "proxy/{port}"
-    elif "prefix" in kwargs:
-        os.environ["LOCALTILESERVER_CLIENT_PREFIX"] = kwargs["prefix"]
-        kwargs.pop("prefix")
-
-    from localtileserver import (
-        get_leaflet_tile_layer,
-        get_folium_tile_layer,
-        TileClient,
-    )
-
-    # if "show_loading" not in kwargs:
-    #     kwargs["show_loading"] = False
-
-    if isinstance(source, str):
-        if not source.startswith("http"):
-            if source.startswith("~"):
-                source = os.path.expanduser(source)
-            # else:
-            #     source = os.path.abspath(source)
-            # if not os.path.exists(source):
-            #     raise ValueError("The source path does not exist.")
-        else:
-            source = github_raw_url(source)
-    elif isinstance(source, TileClient) or isinstance(
-        source, rasterio.io.DatasetReader
-    ):
-        pass
-
-    else:
-        raise ValueError("The source must either be a string or TileClient")
+    from localtileserver import get_leaflet_tile_layer, get_folium_tile_layer
 
     if tile_format not in ["ipyleaflet", "folium"]:
         raise ValueError("The tile format must be either ipyleaflet or folium.")
 
+    source, colormap, indexes, nodata, kwargs = _normalize_local_tile_args(
+        source, colormap, indexes, nodata, client_args, kwargs
+    )
+
     if layer_name is None:
         if source.startswith("http"):
             layer_name = "RemoteTile_" + random_string(3)
         else:
             layer_name = "LocalTile_" + random_string(3)
 
-    if nodata is None:
-        nodata = get_api_key("NODATA")
-        if isinstance(nodata, str):
-            nodata = float(nodata)
-
-    if isinstance(colormap, str):
-        colormap = colormap.lower()
+    if isinstance(source, str):
+        source = _get_tile_client(source, port=port, debug=debug)
 
     if quiet:
         output = widgets.Output()
@@ -3082,95 +3738,19 @@ def get_local_tile_url(
     Returns:
         ipyleaflet.TileLayer | folium.TileLayer: An ipyleaflet.TileLayer or folium.TileLayer.
     """
-    import rasterio
-
     check_package(
         "localtileserver", URL="https://github.com/banesullivan/localtileserver"
     )
-
-    # Handle legacy localtileserver kwargs
-    if "cmap" in kwargs:
-        warnings.warn(
-            "`cmap` is a deprecated keyword argument for get_local_tile_layer. Please use `colormap`."
-        )
-    if "palette" in kwargs:
-        warnings.warn(
-            "`palette` is a deprecated keyword argument for get_local_tile_layer. Please use `colormap`."
-        )
-    if "band" in kwargs or "bands" in kwargs:
-        warnings.warn(
-            "`band` and `bands` are deprecated keyword arguments for get_local_tile_layer. Please use `indexes`."
-        )
-    if "projection" in kwargs:
-        warnings.warn(
-            "`projection` is a deprecated keyword argument for get_local_tile_layer and will be ignored."
-        )
-    if "style" in kwargs:
-        warnings.warn(
-            "`style` is a deprecated keyword argument for get_local_tile_layer and will be ignored."
-        )
-
-    if "max_zoom" not in kwargs:
-        kwargs["max_zoom"] = 30
-    if "max_native_zoom" not in kwargs:
-        kwargs["max_native_zoom"] = 30
-    if "cmap" in kwargs:
-        colormap = kwargs.pop("cmap")
-    if "palette" in kwargs:
-        colormap = kwargs.pop("palette")
-    if "band" in kwargs:
-        indexes = kwargs.pop("band")
-    if "bands" in kwargs:
-        indexes = kwargs.pop("bands")
-
-    for key in client_args:
-        kwargs[key] = client_args[key]
-
-    # Make it compatible with binder and JupyterHub
-    if os.environ.get("JUPYTERHUB_SERVICE_PREFIX") is not None:
-        os.environ["LOCALTILESERVER_CLIENT_PREFIX"] = (
-            f"{os.environ['JUPYTERHUB_SERVICE_PREFIX'].lstrip('/')}/proxy/{{port}}"
-        )
-
-    if is_studio_lab():
-        os.environ["LOCALTILESERVER_CLIENT_PREFIX"] = (
-            f"studiolab/default/jupyter/proxy/{{port}}"
-        )
-    elif is_on_aws():
-        os.environ["LOCALTILESERVER_CLIENT_PREFIX"] = "proxy/{port}"
-    elif "prefix" in kwargs:
-        os.environ["LOCALTILESERVER_CLIENT_PREFIX"] = kwargs["prefix"]
-        kwargs.pop("prefix")
-
     from localtileserver import TileClient
 
-    # if "show_loading" not in kwargs:
-    #     kwargs["show_loading"] = False
+    source, colormap, indexes, nodata, kwargs = _normalize_local_tile_args(
+        source, colormap, indexes, nodata, client_args, kwargs
+    )
 
     if isinstance(source, str):
-        if not source.startswith("http"):
-            if source.startswith("~"):
-                source = os.path.expanduser(source)
-
-        else:
-            source = github_raw_url(source)
-    elif isinstance(source, TileClient) or isinstance(
-        source, rasterio.io.DatasetReader
-    ):
-        pass
-
+        client = _get_tile_client(source, port=port, client_args=client_args)
     else:
-        raise ValueError("The source must either be a string or TileClient")
-
-    if nodata is None:
-        nodata = get_api_key("NODATA")
-        if isinstance(nodata, str):
-            nodata = float(nodata)
-
-    if isinstance(colormap, str):
-        colormap = colormap.lower()
-
-    client = TileClient(source, port=port, **client_args)
+        client = TileClient(source, port=port, **client_args)
     url = client.get_tile_url(
         indexes=indexes,
         colormap=colormap,
@@ -3185,6 +3765,66 @@ def get_local_tile_url(
         return url
 
 
+_PALETTABLE_MODULES = {
+    "cartocolors": [
+        "cartocolors.diverging",
+        "cartocolors.qualitative",
+        "cartocolors.sequential",
+    ],
+    "cmocean": ["cmocean.diverging", "cmocean.sequential"],
+    "colorbrewer": [
+        "colorbrewer.diverging",
+        "colorbrewer.qualitative",
+        "colorbrewer.sequential",
+    ],
+    "cubehelix": ["cubehelix"],
+    "lightbartlein": ["lightbartlein.diverging", "lightbartlein.sequential"],
+    "matplotlib": ["matplotlib"],
+    "mycarta": ["mycarta"],
+    "scientific": ["scientific.diverging", "scientific.sequential"],
+    "tableau": ["tableau"],
+    "wesanderson": [],
+}
+
+_CUBEHELIX_PALETTES = (
+    "classic_16",
+    "cubehelix1_16",
+    "cubehelix2_16",
+    "cubehelix3_16",
+    "jim_special_16",
+    "perceptual_rainbow_16",
+    "purple_16",
+    "red_16",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _palettable_names(module_name):
+    """Lists the palettes defined in a palettable submodule, introspecting it only once.
+
+    Args:
+        module_name (str): The submodule name relative to palettable, e.g., "cmocean.diverging".
+
+    Returns:
+        tuple: The palette names prefixed with the submodule name.
+    """
+    import importlib
+    import inspect
+    from palettable.palette import Palette
+
+    if module_name == "cubehelix":
+        names = _CUBEHELIX_PALETTES
+    else:
+        module = importlib.import_module(f"palettable.{module_name}")
+        names = [
+            name
+            for name, _ in inspect.getmembers(
+                module, lambda obj: isinstance(obj, Palette)
+            )
+        ]
+    return tuple(f"{module_name}.{name}" for name in names)
+
+
 def get_palettable(types=None):
     """Get a list of palettable color palettes.
 
@@ -3199,139 +3839,40 @@ def get_palettable(types=None):
     except ImportError:
         raise ImportError(
             "Please install the palettable package using 'pip install palettable'."
-        )
-
-    if types is not None and (not isinstance(types, list)):
-        raise ValueError("The types must be a list.")
-
-    allowed_palettes = [
-        "cartocolors",
-        "cmocean",
-        "colorbrewer",
-        "cubehelix",
-        "lightbartlein",
-        "matplotlib",
-        "mycarta",
-        "scientific",
-        "tableau",
-        "wesanderson",
-    ]
-
-    if types is None:
-        types = allowed_palettes[:]
-
-    if all(x in allowed_palettes for x in types):
-        pass
-    else:
-        raise ValueError(
-            "The types must be one of the following: " + ", ".join(allowed_palettes)
-        )
-
-    palettes = []
-
-    if "cartocolors" in types:
-        cartocolors_diverging = [
-            f"cartocolors.diverging.{c}"
-            for c in dir(palettable.cartocolors.diverging)[:-19]
-        ]
-        cartocolors_qualitative = [
-            f"cartocolors.qualitative.{c}"
-            for c in dir(palettable.cartocolors.qualitative)[:-19]
-        ]
-        cartocolors_sequential = [
-            f"cartocolors.sequential.{c}"
-            for c in dir(palettable.cartocolors.sequential)[:-41]
-        ]
-
-        palettes = (
-            palettes
-            + cartocolors_diverging
-            + cartocolors_qualitative
-            + cartocolors_sequential
-        )
-
-    if "cmocean" in types:
-        cmocean_diverging = [
-            f"cmocean.diverging.{c}" for c in dir(palettable.cmocean.diverging)[:-19]
-        ]
-        cmocean_sequential = [
-            f"cmocean.sequential.{c}" for c in dir(palettable.cmocean.sequential)[:-19]
-        ]
-
-        palettes = palettes + cmocean_diverging + cmocean_sequential
-
-    if "colorbrewer" in types:
-        colorbrewer_diverging = [
-            f"colorbrewer.diverging.{c}"
-            for c in dir(palettable.colorbrewer.diverging)[:-19]
-        ]
-        colorbrewer_qualitative = [
-            f"colorbrewer.qualitative.{c}"
-            for c in dir(palettable.colorbrewer.qualitative)[:-19]
-        ]
-        colorbrewer_sequential = [
-            f"colorbrewer.sequential.{c}"
-            for c in dir(palettable.colorbrewer.sequential)[:-41]
-        ]
-
-        palettes = (
-            palettes
-            + colorbrewer_diverging
-            + colorbrewer_qualitative
-            + colorbrewer_sequential
-        )
-
-    if "cubehelix" in types:
-        cubehelix = [
-            "classic_16",
-            "cubehelix1_16",
-            "cubehelix2_16",
-            "cubehelix3_16",
-            "jim_special_16",
-            "perceptual_rainbow_16",
-            "purple_16",
-            "red_16",
-        ]
-        cubehelix = [f"cubehelix.{c}" for c in cubehelix]
-        palettes = palettes + cubehelix
-
-    if "lightbartlein" in types:
-        lightbartlein_diverging = [
-            f"lightbartlein.diverging.{c}"
-            for c in dir(palettable.lightbartlein.diverging)[:-19]
-        ]
-        lightbartlein_sequential = [
-            f"lightbartlein.sequential.{c}"
-            for c in dir(palettable.lightbartlein.sequential)[:-19]
-        ]
-
-        palettes = palettes + lightbartlein_diverging + lightbartlein_sequential
+        )
 
-    if "matplotlib" in types:
-        matplotlib_colors = [
-            f"matplotlib.{c}" for c in dir(palettable.matplotlib)[:-16]
-        ]
-        palettes = palettes + matplotlib_colors
+    if types is not None and (not isinstance(types, list)):
+        raise ValueError("The types must be a list.")
 
-    if "mycarta" in types:
-        mycarta = [f"mycarta.{c}" for c in dir(palettable.mycarta)[:-16]]
-        palettes = palettes + mycarta
+    allowed_palettes = [
+        "cartocolors",
+        "cmocean",
+        "colorbrewer",
+        "cubehelix",
+        "lightbartlein",
+        "matplotlib",
+        "mycarta",
+        "scientific",
+        "tableau",
+        "wesanderson",
+    ]
 
-    if "scientific" in types:
-        scientific_diverging = [
-            f"scientific.diverging.{c}"
-            for c in dir(palettable.scientific.diverging)[:-19]
-        ]
-        scientific_sequential = [
-            f"scientific.sequential.{c}"
-            for c in dir(palettable.scientific.sequential)[:-19]
-        ]
+    if types is None:
+        types = allowed_palettes[:]
 
-        palettes = palettes + scientific_diverging + scientific_sequential
+    if all(x in allowed_palettes for x in types):
+        pass
+    else:
+        raise ValueError(
+            "The types must be one of the following: " + ", ".join(allowed_palettes)
+        )
 
-    if "tableau" in types:
-        tableau = [f"tableau.{c}" for c in dir(palettable.tableau)[:-14]]
-        palettes = palettes + tableau
+    palettes = []
+    for palette_type in allowed_palettes:
+        if palette_type not in types:
+            continue
+        for module_name in _PALETTABLE_MODULES[palette_type]:
+            palettes.extend(_palettable_names(module_name))
 
     return palettes
 
@@ -3345,13 +3886,13 @@ def points_from_xy(data, x=None, y=None, z=None, crs=None, **kwargs):
         y (str, optional): The column name for the y values. Defaults to "latitude".
         z (str, optional): The column name for the z values. Defaults to None.
         crs (str | int, optional): The coordinate reference system for the GeoDataFrame. Defaults to None.
+        **kwargs: Additional keyword arguments to pass to pandas.read_csv(), e.g., engine="pyarrow".
 
     Returns:
         geopandas.GeoDataFrame: A GeoPandas GeoDataFrame containing x, y, z values.
     """
     check_package(name="geopandas", URL="https://geopandas.org")
     import geopandas as gpd
-    import pandas as pd
 
     if crs is None:
         crs = "epsg:4326"
@@ -3366,29 +3907,31 @@ def points_from_xy(data, x=None, y=None, z=None, crs=None, **kwargs):
     else:
         raise TypeError("The data must be a pandas DataFrame or a csv file path.")
 
-    columns = df.columns
+    columns = set(df.columns)
 
     if x is None:
-        if "longitude" in columns:
-            x = "longitude"
-        elif "x" in columns:
-            x = "x"
-        elif "lon" in columns:
-            x = "lon"
-        else:
+        x = next((c for c in ("longitude", "x", "lon") if c in columns), None)
+        if x is None:
             raise ValueError("The x column could not be found.")
 
     if y is None:
-        if "latitude" in columns:
-            y = "latitude"
-        elif "y" in columns:
-            y = "y"
-        elif "lat" in columns:
-            y = "lat"
-        else:
+        y = next((c for c in ("latitude", "y", "lat") if c in columns), None)
+        if y is None:
             raise ValueError("The y column could not be found.")
 
-    gdf = gpd.GeoDataFrame(df, geometry=gpd.points_from_xy(df[x], df[y], z=z, crs=crs))
+    coords = [
+        np.ascontiguousarray(df[col].to_numpy(dtype=np.float64))
+        for col in (x, y, z)
+        if col is not None
+    ]
+    try:
+        import shapely
+
+        geometry = shapely.points(*coords)
+    except (ImportError, AttributeError):
+        # Shapely < 2.0 has no vectorized constructor.
+        geometry = gpd.points_from_xy(*coords)
+    gdf = gpd.GeoDataFrame(df, geometry=geometry, crs=crs)
 
     return gdf
 
@@ -3423,25 +3966,20 @@ def html_to_streamlit(
         import streamlit.components.v1 as components  # pylint: disable=E0401
 
         if isinstance(html, str):
-            temp_path = None
             if html.startswith("http") and html.endswith(".html"):
-                temp_path = temp_file_path(".html")
-                out_file = os.path.basename(temp_path)
-                out_dir = os.path.dirname(temp_path)
-                download_from_url(html, out_file, out_dir)
-                html = temp_path
+                response = _SESSION.get(html, timeout=30)
+                response.raise_for_status()
+                html_str = response.text
 
             elif not os.path.exists(html):
                 raise FileNotFoundError("The specified input html does not exist.")
 
-            with open(html) as f:
-                lines = f.readlines()
-                if (token_name is not None) and (token_value is not None):
-                    lines = [line.replace(token_name, token_value) for line in lines]
-                html_str = "".join(lines)
+            else:
+                with open(html) as f:
+                    html_str = f.read()
 
-            if temp_path is not None:
-                os.remove(temp_path)
+            if (token_name is not None) and (token_value is not None):
+                html_str = html_str.replace(token_name, token_value)
 
             if responsive:
                 make_map_responsive = """
@@ -3490,7 +4028,7 @@ def cesium_to_streamlit(
     if token_value is None:
         token_value = os.environ.get("CESIUM_TOKEN")
 
-    html_to_streamlit(
+    return html_to_streamlit(
         html, width, height, responsive, scrolling, token_name, token_value
     )
 
@@ -3506,12 +4044,23 @@ def geom_type(in_geojson, encoding="utf-8"):
         str: The geometry type of the GeoJSON object, such as Point, LineString, Polygon, MultiPoint, MultiLineString, MultiPolygon.
             For more info, see https://shapely.readthedocs.io/en/stable/manual.html
     """
-    import json
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
 
     try:
         if isinstance(in_geojson, str):
             if in_geojson.startswith("http"):
-                data = requests.get(in_geojson).json()
+                if ijson is not None:
+                    # Stop reading as soon as the first geometry type is parsed.
+                    with _SESSION.get(in_geojson, stream=True, timeout=60) as r:
+                        r.raise_for_status()
+                        r.raw.decode_content = True
+                        return next(ijson.items(r.raw, "features.item.geometry.type"))
+                r = _SESSION.get(in_geojson, timeout=60)
+                r.raise_for_status()
+                data = r.json()
             else:
                 in_geojson = os.path.abspath(in_geojson)
                 if not os.path.exists(in_geojson):
@@ -3519,6 +4068,9 @@ def geom_type(in_geojson, encoding="utf-8"):
                         "The provided GeoJSON file could not be found."
                     )
 
+                if ijson is not None and codecs.lookup(encoding).name == "utf-8":
+                    with open(in_geojson, "rb") as f:
+                        return next(ijson.items(f, "features.item.geometry.type"))
                 with open(in_geojson, encoding=encoding) as f:
                     data = json.load(f)
         elif isinstance(in_geojson, dict):
@@ -3532,6 +4084,45 @@ def geom_type(in_geojson, encoding="utf-8"):
         raise Exception(e)
 
 
+def _geojson_dict_to_gdf(data, **kwargs):
+    """Builds a GeoDataFrame directly from an in-memory GeoJSON dict.
+
+    The result has the same columns as geopandas.read_file: string feature ids
+    are kept as an "id" column and the geometry column comes last.
+
+    Args:
+        data (dict): A GeoJSON FeatureCollection or Feature.
+        kwargs: Additional keyword arguments to pass to the geopandas.read_file function.
+            When given, the dict is read through geopandas.read_file instead.
+
+    Returns:
+        geopandas.GeoDataFrame: A geopandas GeoDataFrame containing the features.
+    """
+    import io
+    import geopandas as gpd
+
+    if kwargs:
+        # Options such as rows, bbox, mask or columns need the GDAL reader.
+        kwargs.pop("encoding", None)
+        return gpd.read_file(io.BytesIO(json.dumps(data).encode("utf-8")), **kwargs)
+
+    if data.get("type") == "Feature":
+        features = [data]
+    else:
+        features = data["features"]
+    crs = (data.get("crs") or {}).get("properties", {}).get("name", "EPSG:4326")
+    gdf = gpd.GeoDataFrame.from_features(features, crs=crs)
+
+    # GDAL uses integer ids as feature ids and exposes any other ids as a field.
+    ids = [feature.get("id") for feature in features]
+    if "id" not in gdf.columns and any(
+        i is not None and not isinstance(i, int) for i in ids
+    ):
+        gdf.insert(0, "id", [None if i is None else str(i) for i in ids])
+    columns = [column for column in gdf.columns if column != "geometry"]
+    return gdf[columns + ["geometry"]]
+
+
 def geojson_to_gdf(in_geojson, encoding="utf-8", **kwargs):
     """Converts a GeoJSON object to a geopandas GeoDataFrame.
 
@@ -3546,10 +4137,7 @@ def geojson_to_gdf(in_geojson, encoding="utf-8", **kwargs):
     import geopandas as gpd
 
     if isinstance(in_geojson, dict):
-        out_file = temp_file_path(extension="geojson")
-        with open(out_file, "w") as f:
-            json.dump(in_geojson, f)
-            in_geojson = out_file
+        return _geojson_dict_to_gdf(in_geojson, **kwargs)
 
     gdf = gpd.read_file(in_geojson, encoding=encoding, **kwargs)
     return gdf
@@ -3570,32 +4158,80 @@ def geojson_to_df(in_geojson, encoding="utf-8", drop_geometry=True):
         pd.DataFrame: A pandas DataFrame containing the GeoJSON object.
     """
 
-    import json
-    import pandas as pd
-    from urllib.request import urlopen
-
     if isinstance(in_geojson, str):
         if in_geojson.startswith("http"):
-            with urlopen(in_geojson) as f:
-                data = json.load(f)
+            r = _SESSION.get(in_geojson, timeout=60)
+            r.raise_for_status()
+            data = r.json()
         else:
             in_geojson = os.path.abspath(in_geojson)
             if not os.path.exists(in_geojson):
                 raise FileNotFoundError("The provided GeoJSON file could not be found.")
 
-            with open(in_geojson, encoding=encoding) as f:
-                data = json.load(f)
+            data = _read_json(in_geojson, encoding)
 
     elif isinstance(in_geojson, dict):
         data = in_geojson
 
-    df = pd.json_normalize(data["features"])
+    features = data["features"]
+    if drop_geometry:
+        # Leave the coordinates out instead of flattening and then dropping them.
+        features = [
+            {key: value for key, value in feature.items() if key != "geometry"}
+            for feature in features
+        ]
+    df = pd.json_normalize(features)
     df.columns = [col.replace("properties.", "") for col in df.columns]
     if drop_geometry:
-        df = df[df.columns.drop(list(df.filter(regex="geometry")))]
+        df = df.drop(
+            columns=[
+                col
+                for col in df.columns
+                if col == "geometry" or col.startswith("geometry.")
+            ]
+        )
     return df
 
 
+@functools.lru_cache(maxsize=None)
+def _has_pyogrio_arrow(min_gdal_version):
+    """Checks whether pyogrio can exchange data with GDAL through Arrow.
+
+    Args:
+        min_gdal_version (tuple): The minimum GDAL version the Arrow operation
+            needs, e.g., (3, 8, 0) for writing.
+
+    Returns:
+        bool: True if pyarrow is installed and pyogrio >= 0.8 is linked to a
+            recent enough GDAL.
+    """
+    try:
+        import pyarrow  # noqa: F401
+        import pyogrio
+    except ImportError:
+        return False
+    version = tuple(int(v) for v in pyogrio.__version__.split(".")[:2])
+    return version >= (0, 8) and pyogrio.__gdal_version__ >= min_gdal_version
+
+
+@functools.lru_cache(maxsize=None)
+def _vector_write_kwargs(engine):
+    """Returns extra GeoDataFrame.to_file() arguments for the given I/O engine.
+
+    pyogrio >= 0.8 can hand the whole table to GDAL >= 3.8 through Arrow when
+    pyarrow is installed, instead of converting it record by record.
+
+    Args:
+        engine (str): The geopandas I/O engine, either "pyogrio" or "fiona".
+
+    Returns:
+        dict: The keyword arguments to pass to to_file().
+    """
+    if engine == "pyogrio" and _has_pyogrio_arrow((3, 8, 0)):
+        return {"use_arrow": True}
+    return {}
+
+
 def geojson_to_shp(in_geojson, out_shp, **kwargs):
     """Converts a GeoJSON object to GeoPandas GeoDataFrame.
 
@@ -3604,47 +4240,50 @@ def geojson_to_shp(in_geojson, out_shp, **kwargs):
         out_shp (str): The output shapefile path.
     """
     import geopandas as gpd
-    import json
 
     ext = os.path.splitext(out_shp)[1]
     if ext != ".shp":
         out_shp = out_shp + ".shp"
     out_shp = check_file_path(out_shp)
 
+    engine = kwargs.pop("engine", _vector_engine())
     if isinstance(in_geojson, dict):
-        out_file = temp_file_path(extension="geojson")
-        with open(out_file, "w") as f:
-            json.dump(in_geojson, f)
-            in_geojson = out_file
-
-    gdf = gpd.read_file(in_geojson, **kwargs)
-    gdf.to_file(out_shp)
+        gdf = _geojson_dict_to_gdf(in_geojson, **kwargs)
+    else:
+        gdf = gpd.read_file(in_geojson, engine=engine, **kwargs)
+    gdf.to_file(out_shp, engine=engine, **_vector_write_kwargs(engine))
 
 
-def geojson_to_gpkg(in_geojson, out_gpkg, **kwargs):
+def geojson_to_gpkg(in_geojson, out_gpkg, layer=None, **kwargs):
     """Converts a GeoJSON object to GeoPackage.
 
     Args:
         in_geojson (str | dict): The input GeoJSON file or dict.
         out_gpkg (str): The output GeoPackage path.
+        layer (str, optional): The layer name in the GeoPackage. Defaults to None,
+            which uses the base name of the output file.
     """
     import geopandas as gpd
-    import json
 
     ext = os.path.splitext(out_gpkg)[1]
     if ext.lower() != ".gpkg":
         out_gpkg = out_gpkg + ".gpkg"
     out_gpkg = check_file_path(out_gpkg)
 
+    engine = kwargs.pop("engine", _vector_engine())
     if isinstance(in_geojson, dict):
-        out_file = temp_file_path(extension="geojson")
-        with open(out_file, "w") as f:
-            json.dump(in_geojson, f)
-            in_geojson = out_file
-
-    gdf = gpd.read_file(in_geojson, **kwargs)
-    name = os.path.splitext(os.path.basename(out_gpkg))[0]
-    gdf.to_file(out_gpkg, layer=name, driver="GPKG")
+        gdf = _geojson_dict_to_gdf(in_geojson, **kwargs)
+    else:
+        gdf = gpd.read_file(in_geojson, engine=engine, **kwargs)
+    if layer is None:
+        layer = os.path.splitext(os.path.basename(out_gpkg))[0]
+    gdf.to_file(
+        out_gpkg,
+        layer=layer,
+        driver="GPKG",
+        engine=engine,
+        **_vector_write_kwargs(engine),
+    )
 
 
 def gdf_to_df(gdf, drop_geom=True):
@@ -3657,12 +4296,10 @@ def gdf_to_df(gdf, drop_geom=True):
     Returns:
         pd.DataFrame: A pandas DataFrame containing the GeoDataFrame.
     """
-    import pandas as pd
-
+    df = pd.DataFrame(gdf)
     if drop_geom:
-        df = pd.DataFrame(gdf.drop(columns=["geometry"]))
-    else:
-        df = pd.DataFrame(gdf)
+        # Drop from the plain DataFrame to skip the GeoDataFrame drop machinery.
+        df = df.drop(columns=gdf.geometry.name)
 
     return df
 
@@ -3677,7 +4314,20 @@ def gdf_bounds(gdf, return_geom=False):
     Returns:
         list | gpd.GeoDataFrame: A bounding box in the form of a list (minx, miny, maxx, maxy) or GeoDataFrame.
     """
-    bounds = gdf.total_bounds
+    try:
+        import shapely
+
+        # Reduce the (N, 4) bounds array in NumPy; empty geometries yield NaN.
+        boxes = shapely.bounds(np.asarray(gdf.geometry.array))
+        if len(boxes) == 0:
+            bounds = np.full(4, np.nan)
+        else:
+            bounds = np.concatenate(
+                [np.nanmin(boxes[:, :2], axis=0), np.nanmax(boxes[:, 2:], axis=0)]
+            )
+    except (ImportError, AttributeError):
+        # Shapely < 2.0 has no vectorized bounds function.
+        bounds = gdf.total_bounds
     if return_geom:
         return bbox_to_gdf(bbox=bounds)
     else:
@@ -3697,11 +4347,11 @@ def gdf_centroid(gdf, return_geom=False):
 
     warnings.filterwarnings("ignore")
 
-    centroid = gdf_bounds(gdf, return_geom=True).centroid
     if return_geom:
-        return centroid
-    else:
-        return centroid.x[0], centroid.y[0]
+        return gdf_bounds(gdf, return_geom=True).centroid
+
+    minx, miny, maxx, maxy = gdf_bounds(gdf)
+    return (minx + maxx) / 2.0, (miny + maxy) / 2.0
 
 
 def gdf_geom_type(gdf, first_only=True):
@@ -3717,12 +4367,12 @@ def gdf_geom_type(gdf, first_only=True):
             Polygon, MultiPoint, MultiLineString, MultiPolygon.
             For more info, see https://shapely.readthedocs.io/en/stable/manual.html
     """
-    import geopandas as gpd
-
     if first_only:
-        return gdf.geometry.type[0]
+        # Look up the first geometry only instead of typing the whole column.
+        geometry = gdf.geometry.iloc[0]
+        return None if geometry is None else geometry.geom_type
     else:
-        return gdf.geometry.type
+        return gdf.geometry.geom_type
 
 
 def vector_geom_type(data, first_only=True, **kwargs):
@@ -3742,13 +4392,18 @@ def vector_geom_type(data, first_only=True, **kwargs):
     """
     import geopandas as gpd
 
-    if isinstance(data, str) or isinstance(data, dict):
-        gdf = gpd.read_file(data, **kwargs)
-
-    if first_only:
-        return gdf.geometry.type[0]
+    if isinstance(data, dict):
+        gdf = _geojson_dict_to_gdf(data, **kwargs)
+    elif isinstance(data, str):
+        if first_only:
+            # Only the first feature is needed, so do not read the whole layer.
+            kwargs.setdefault("rows", 1)
+        engine = kwargs.pop("engine", _vector_engine())
+        gdf = gpd.read_file(data, engine=engine, **kwargs)
     else:
-        return gdf.geometry.type
+        gdf = data
+
+    return gdf_geom_type(gdf, first_only)
 
 
 def check_dir(dir_path, make_dirs=True):
@@ -3819,23 +4474,96 @@ def dict_to_json(data, file_path, indent=4):
     Args:
         data (dict): A dictionary.
         file_path (str): The path to the JSON file.
-        indent (int, optional): The indentation of the JSON file. Defaults to 4.
+        indent (int, optional): The indentation of the JSON file. Use 2 or None to
+            serialize with orjson when it is installed. Defaults to 4.
 
     Raises:
         TypeError: If the input data is not a dictionary.
     """
-    import json
-
     file_path = check_file_path(file_path)
 
     if isinstance(data, dict):
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=indent)
+        _write_json(data, file_path, indent=indent)
     else:
         raise TypeError("The provided data must be a dictionary.")
 
 
-def image_to_geotiff(image, dst_path, dtype=None, to_cog=True, **kwargs) -> None:
+# Compression methods that benefit from a TIFF predictor.
+_PREDICTOR_COMPRESSIONS = ("DEFLATE", "LZW", "ZSTD", "LZMA")
+
+
+def _cog_predictor(dtype) -> int:
+    """Returns the TIFF predictor suited to a data type.
+
+    Args:
+        dtype (str | np.dtype): The data type of the raster.
+
+    Returns:
+        int: 3 (floating point) for floats, 2 (horizontal differencing) for
+            integers, and 1 (none) otherwise.
+    """
+    dtype = np.dtype(dtype)
+    if np.issubdtype(dtype, np.floating):
+        return 3
+    if np.issubdtype(dtype, np.integer):
+        return 2
+    return 1
+
+
+def _cog_overview_resampling(dtype) -> str:
+    """Returns the overview resampling method suited to a data type.
+
+    Args:
+        dtype (str | np.dtype): The data type of the raster.
+
+    Returns:
+        str: "average" for continuous (floating-point) data, "nearest" otherwise.
+    """
+    return "average" if np.issubdtype(np.dtype(dtype), np.floating) else "nearest"
+
+
+def _cog_options(
+    dtype, predictor=None, blocksize=512, overview_resampling=None
+) -> dict:
+    """Returns GDAL COG driver creation options for a data type.
+
+    Args:
+        dtype (str | np.dtype): The data type of the raster.
+        predictor (int, optional): The TIFF predictor. Defaults to None, which picks one from the data type.
+        blocksize (int, optional): The tile size in pixels. Defaults to 512.
+        overview_resampling (str, optional): The overview resampling method. Defaults to None,
+            which picks one from the data type.
+
+    Returns:
+        dict: The creation options.
+    """
+    if predictor is None:
+        predictor = _cog_predictor(dtype)
+    if overview_resampling is None:
+        overview_resampling = _cog_overview_resampling(dtype)
+    return {
+        "compress": "deflate",
+        "predictor": predictor,
+        "blocksize": blocksize,
+        "overview_resampling": overview_resampling,
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _has_cog_driver() -> bool:
+    """Checks whether GDAL provides the native COG driver (GDAL >= 3.1).
+
+    Returns:
+        bool: True if the COG driver is available.
+    """
+    from rasterio.env import GDALVersion
+
+    return GDALVersion.runtime().at_least("3.1")
+
+
+def image_to_geotiff(
+    image, dst_path, dtype=None, to_cog=True, use_rio_cogeo=False, **kwargs
+) -> None:
     """
     Converts an image to a GeoTIFF file.
 
@@ -3849,6 +4577,8 @@ def image_to_geotiff(image, dst_path, dtype=None, to_cog=True, **kwargs) -> None
         dtype (Optional[str]): The data type for the output GeoTIFF file. If None, the data type of the input image
             will be used. Defaults to None.
         to_cog (bool): Whether to convert the output GeoTIFF to a Cloud Optimized GeoTIFF (COG). Defaults to True.
+        use_rio_cogeo (bool): Whether to create the COG with rio-cogeo instead of GDAL's native COG driver.
+            Defaults to False.
         **kwargs: Additional keyword arguments to be included in the GeoTIFF profile.
 
     Raises:
@@ -3858,13 +4588,23 @@ def image_to_geotiff(image, dst_path, dtype=None, to_cog=True, **kwargs) -> None
         None
     """
     import rasterio
+    import rasterio.shutil
     from rasterio.enums import Resampling
+    from rasterio.windows import Window
 
     if not isinstance(image, rasterio.io.DatasetReader):
         raise ValueError("The input image must be a rasterio.io.DatasetReader object.")
 
     dst_path = check_file_path(dst_path)
 
+    if to_cog and not use_rio_cogeo and dtype is None and not kwargs:
+        if _has_cog_driver():
+            # GDAL writes the COG and its overviews in one streaming pass.
+            rasterio.shutil.copy(
+                image, dst_path, driver="COG", **_cog_options(image.dtypes[0])
+            )
+            return
+
     profile = image.profile
     if dtype is not None:
         profile["dtype"] = dtype
@@ -3872,14 +4612,35 @@ def image_to_geotiff(image, dst_path, dtype=None, to_cog=True, **kwargs) -> None
     for key, value in kwargs.items():
         profile[key] = value
 
+    if image.profile.get("tiled"):
+        windows = (window for _, window in image.block_windows(1))
+    else:
+        # Copy strips of about 64 MiB when the source has no internal tiles.
+        row_bytes = image.width * image.count * np.dtype(image.dtypes[0]).itemsize
+        rows = max(1, (64 << 20) // row_bytes)
+        windows = (
+            Window(0, row, image.width, min(rows, image.height - row))
+            for row in range(0, image.height, rows)
+        )
+
     with rasterio.open(dst_path, "w", **profile) as dst:
-        dst.write(image.read())
+        for window in windows:
+            dst.write(image.read(window=window), window=window)
 
     if to_cog:
         image_to_cog(dst_path, dst_path)
 
 
-def image_to_cog(source, dst_path=None, profile="deflate", BIGTIFF=None, **kwargs):
+def image_to_cog(
+    source,
+    dst_path=None,
+    profile="deflate",
+    BIGTIFF=None,
+    predictor=None,
+    blocksize=512,
+    overview_resampling=None,
+    **kwargs,
+):
     """Converts an image to a COG file.
 
     Args:
@@ -3887,6 +4648,11 @@ def image_to_cog(source, dst_path=None, profile="deflate", BIGTIFF=None, **kwarg
         dst_path (str, optional): An output dataset path or or PathLike object. Defaults to None.
         profile (str, optional): COG profile. More at https://cogeotiff.github.io/rio-cogeo/profile. Defaults to "deflate".
         BIGTIFF (str, optional): Create a BigTIFF file. Can be "IF_SAFER" or "YES". Defaults to None.
+        predictor (int, optional): The TIFF predictor for lossless profiles. Defaults to None, which uses 3 for
+            floating-point data and 2 for integer data.
+        blocksize (int, optional): The tile size in pixels. Defaults to 512.
+        overview_resampling (str, optional): The overview resampling method. Defaults to None, which uses
+            "average" for floating-point data and "nearest" otherwise.
 
     Raises:
         ImportError: If rio-cogeo is not installed.
@@ -3921,7 +4687,63 @@ def image_to_cog(source, dst_path=None, profile="deflate", BIGTIFF=None, **kwarg
 
     if BIGTIFF is not None:
         dst_profile.update({"BIGTIFF": BIGTIFF})
-    cog_translate(source, dst_path, dst_profile, **kwargs)
+
+    dst_profile.update({"blockxsize": blocksize, "blockysize": blocksize})
+    if predictor is None or overview_resampling is None:
+        import rasterio
+
+        with rasterio.open(source) as src:
+            dtype = src.dtypes[0]
+        if predictor is None:
+            predictor = _cog_predictor(dtype)
+        if overview_resampling is None:
+            overview_resampling = _cog_overview_resampling(dtype)
+    if str(dst_profile.get("compress", "")).upper() in _PREDICTOR_COMPRESSIONS:
+        dst_profile["predictor"] = predictor
+
+    # Let GDAL compress the blocks with all CPU cores.
+    kwargs.setdefault("config", {"GDAL_NUM_THREADS": "ALL_CPUS"})
+    cog_translate(
+        source,
+        dst_path,
+        dst_profile,
+        overview_resampling=overview_resampling,
+        **kwargs,
+    )
+
+
+def image_to_cog_batch(sources, dst_paths=None, max_workers=None, **kwargs):
+    """Converts multiple images to COG files concurrently.
+
+    Args:
+        sources (list): A list of dataset paths or URLs.
+        dst_paths (list, optional): A list of output dataset paths, one per source.
+            Defaults to None, which derives the output paths as image_to_cog() does.
+        max_workers (int, optional): The maximum number of threads to use.
+            Defaults to None, which uses the ThreadPoolExecutor default.
+        **kwargs: Additional keyword arguments to pass to image_to_cog().
+
+    Raises:
+        ValueError: If the number of sources and output paths differ.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    sources = list(sources)
+    if dst_paths is None:
+        dst_paths = [None] * len(sources)
+    else:
+        dst_paths = list(dst_paths)
+    if len(sources) != len(dst_paths):
+        raise ValueError("The number of sources and dst_paths must be the same.")
+
+    # GDAL releases the GIL while reading, compressing and writing, so the
+    # conversions overlap across threads.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(
+            executor.map(
+                lambda args: image_to_cog(*args, **kwargs), zip(sources, dst_paths)
+            )
+        )
 
 
 def cog_validate(source, verbose=False):
@@ -4015,32 +4837,35 @@ def numpy_to_image(
         raise TypeError("The provided input must be a numpy array.")
 
     if np_array.dtype == np.float64 or np_array.dtype == np.float32:
-        # Convert the array to uint8
-        # np_array = (np_array * 255).astype(np.uint8)
-        np.interp(np_array, (np_array.min(), np_array.max()), (0, 255)).astype(np.uint8)
-    else:
-        # The array is already uint8
-        np_array = np_array
+        # Stretch the values linearly to uint8 in a single pass over the array.
+        vmin, vmax = np_array.min(), np_array.max()
+        scale = 255.0 / (vmax - vmin) if vmax > vmin else 0.0
+        np_array = ((np_array - vmin) * scale).astype(np.uint8)
 
     if np_array.ndim == 2:
         img = Image.fromarray(np_array)
     elif np_array.ndim == 3:
-        if transpose:
-            np_array = np_array.transpose(1, 2, 0)
+        band_axis = 0 if transpose else 2
+        index = slice(None)
         if bands is None:
-            if np_array.shape[2] < 3:
-                np_array = np_array[:, :, 0]
-            elif np_array.shape[2] > 3:
-                np_array = np_array[:, :, :3]
-
+            if np_array.shape[band_axis] < 3:
+                index = 0
+            elif np_array.shape[band_axis] > 3:
+                index = slice(None, 3)
         elif isinstance(bands, list):
-            if len(bands) == 1:
-                np_array = np_array[:, :, bands[0]]
-            else:
-                np_array = np_array[:, :, bands]
+            index = bands[0] if len(bands) == 1 else bands
         elif isinstance(bands, int):
-            np_array = np_array[:, :, bands]
-        img = Image.fromarray(np_array)
+            index = bands
+
+        # Select the bands before moving them last so only the kept bands are
+        # copied, and copy once into the contiguous layout PIL needs.
+        if transpose:
+            np_array = np_array[index]
+            if np_array.ndim == 3:
+                np_array = np.moveaxis(np_array, 0, -1)
+        else:
+            np_array = np_array[:, :, index]
+        img = Image.fromarray(np.ascontiguousarray(np_array))
     else:
         raise ValueError("The provided input must be a 2D or 3D numpy array.")
 
@@ -4070,6 +4895,10 @@ def numpy_to_cog(
     dtype=None,
     dst_crs=None,
     coord_crs=None,
+    use_rio_cogeo=False,
+    predictor=None,
+    blocksize=512,
+    overview_resampling=None,
 ):
     """Converts a numpy array to a COG file.
 
@@ -4081,6 +4910,13 @@ def numpy_to_cog(
         dtype (str, optional): The data type of the output COG file. Defaults to None.
         dst_crs (str, optional): The coordinate reference system of the output COG file. Defaults to "epsg:4326".
         coord_crs (str, optional): The coordinate reference system of bbox coordinates. Defaults to None.
+        use_rio_cogeo (bool, optional): Whether to create the COG with rio-cogeo instead of GDAL's native
+            COG driver. Defaults to False.
+        predictor (int, optional): The TIFF predictor. Defaults to None, which uses 3 for floating-point
+            data and 2 for integer data.
+        blocksize (int, optional): The tile size in pixels. Defaults to 512.
+        overview_resampling (str, optional): The overview resampling method. Defaults to None, which uses
+            "average" for floating-point data and "nearest" otherwise.
 
     """
 
@@ -4089,14 +4925,20 @@ def numpy_to_cog(
     from rasterio.io import MemoryFile
     from rasterio.transform import from_bounds
 
-    from rio_cogeo.cogeo import cog_translate
-    from rio_cogeo.profiles import cog_profiles
-
     warnings.filterwarnings("ignore")
 
     if isinstance(np_array, str):
         with rasterio.open(np_array, "r") as ds:
             np_array = ds.read()
+            # Reuse the georeferencing of the source instead of the default bounds.
+            if bounds is None:
+                bounds = tuple(ds.bounds)
+            if dst_crs is None:
+                dst_crs = ds.crs
+            if profile is None:
+                profile = dict(ds.profile)
+                if dtype is not None:
+                    profile["dtype"] = dtype
 
     if not isinstance(np_array, np.ndarray):
         raise TypeError("The input array must be a numpy array.")
@@ -4165,16 +5007,41 @@ def numpy_to_cog(
             transform=src_transform,
         )
 
+    cog_options = _cog_options(
+        src_profile.get("dtype", dtype), predictor, blocksize, overview_resampling
+    )
+
+    if not use_rio_cogeo and _has_cog_driver():
+        dst_profile = {
+            key: value
+            for key, value in src_profile.items()
+            if key
+            not in ("tiled", "blockxsize", "blockysize", "interleave", "predictor")
+        }
+        dst_profile.update(driver="COG", **cog_options)
+        with rasterio.open(out_cog, "w", **dst_profile) as dst:
+            dst.write(np_array)
+        return
+
+    from rio_cogeo.cogeo import cog_translate
+    from rio_cogeo.profiles import cog_profiles
+
     with MemoryFile() as memfile:
         with memfile.open(**src_profile) as mem:
             # Populate the input file with numpy array
             mem.write(np_array)
 
             dst_profile = cog_profiles.get("deflate")
+            dst_profile.update(
+                predictor=cog_options["predictor"],
+                blockxsize=blocksize,
+                blockysize=blocksize,
+            )
             cog_translate(
                 mem,
                 out_cog,
                 dst_profile,
+                overview_resampling=cog_options["overview_resampling"],
                 in_memory=True,
                 quiet=True,
             )
@@ -4249,10 +5116,16 @@ def get_stac_items(
     import itertools
     import geopandas as gpd
     from shapely.geometry import shape
-    from pystac_client import Client
-
-    # Empty list that would be used for a dataframe to collect and visualize info about collections
-    items_list = []
+    from pystac_client import Client, ItemSearch
+
+    # Columns of the dataframe used to collect and visualize info about the items
+    columns = {
+        "id": [],
+        "geometry": [],
+        "datetime": [],
+        "self_url": [],
+        "assets_list": [],
+    }
 
     if open_args is None:
         open_args = {}
@@ -4261,6 +5134,8 @@ def get_stac_items(
 
     if limit:
         kwargs["limit"] = limit
+        # Stop paging once enough items have been returned.
+        kwargs["max_items"] = limit
     if bbox:
         kwargs["bbox"] = bbox
     if datetime:
@@ -4278,51 +5153,51 @@ def get_stac_items(
     else:
         catalog = root_catalog
 
-    iterable = catalog.get_all_items()
-    items = list(
-        itertools.islice(iterable, limit)
-    )  # getting first 25000 items. To Do some smarter logic
-    if len(items) == 0:
-        try:
-            catalog = root_catalog.get_child(collection)
+    def collect_items(catalog):
+        if isinstance(catalog, ItemSearch):
+            iterable = catalog.items()
+        else:
             iterable = catalog.get_all_items()
-            items = list(itertools.islice(iterable, limit))
+        # Iterating over items to collect main information
+        for item in itertools.islice(iterable, limit):
+            datetime = (
+                item.datetime
+                or item.properties["datetime"]
+                or item.properties["end_datetime"]
+                or item.properties["start_datetime"]
+            )
+            for link in item.links:
+                if link.rel == "self":
+                    self_url = link.target
+
+            columns["id"].append(item.id)
+            columns["geometry"].append(item.geometry)
+            # specifically for KeplerGL. See https://github.com/keplergl/kepler.gl/issues/602
+            columns["datetime"].append(str(datetime))
+            columns["self_url"].append(self_url)
+            columns["assets_list"].append(list(item.assets))
+
+    collect_items(catalog)
+    if len(columns["id"]) == 0:
+        try:
+            collect_items(root_catalog.get_child(collection))
         except Exception as _:
             print("Ooops, it looks like this collection does not have items.")
             return None
-    # Iterating over items to collect main information
-    for item in items:
-        id = item.id
-        geometry = shape(item.geometry)
-        datetime = (
-            item.datetime
-            or item.properties["datetime"]
-            or item.properties["end_datetime"]
-            or item.properties["start_datetime"]
-        )
-        links = item.links
-        for link in links:
-            if link.rel == "self":
-                self_url = link.target
-        assets_list = []
-        assets = item.assets
-        for asset in assets:
-            assets_list.append(asset)
 
-        # creating a list of lists of values
-        items_list.append([id, geometry, datetime, self_url, assets_list])
+    try:
+        import shapely
 
-    if limit is not None:
-        items_list = items_list[:limit]
-    items_df = gpd.GeoDataFrame(items_list)
-    items_df.columns = ["id", "geometry", "datetime", "self_url", "assets_list"]
+        # One GEOS call parses all the geometries instead of shape() per item.
+        columns["geometry"] = shapely.from_geojson(
+            np.array([json.dumps(geom) for geom in columns["geometry"]], dtype=object)
+        )
+    except Exception:
+        # Shapely < 2.0 or GEOS < 3.10 cannot parse GeoJSON in bulk.
+        columns["geometry"] = [shape(geom) for geom in columns["geometry"]]
 
-    items_gdf = items_df.set_geometry("geometry")
-    items_gdf["datetime"] = items_gdf["datetime"].astype(
-        str
-    )  # specifically for KeplerGL. See https://github.com/keplergl/kepler.gl/issues/602
+    items_gdf = gpd.GeoDataFrame(columns, geometry="geometry", crs="EPSG:4326")
     # items_gdf["assets_list"] = items_gdf["assets_list"].astype(str) #specifically for KeplerGL. See https://github.com/keplergl/kepler.gl/issues/602
-    items_gdf.set_crs(epsg=4326, inplace=True)
     return items_gdf
 
 
@@ -4332,6 +5207,16 @@ def list_palettes(add_extra=False, lowercase=False):
     Returns:
         list: The list of colormap names.
     """
+    return list(_list_palettes_cached(add_extra, lowercase))
+
+
+@functools.lru_cache(maxsize=4)
+def _list_palettes_cached(add_extra=False, lowercase=False):
+    """Lists the available colormaps, reusing the result for repeated arguments.
+
+    Returns:
+        tuple: The sorted colormap names.
+    """
     import matplotlib.pyplot as plt
 
     result = plt.colormaps()
@@ -4340,7 +5225,7 @@ def list_palettes(add_extra=False, lowercase=False):
     if lowercase:
         result = [i.lower() for i in result]
     result.sort()
-    return result
+    return tuple(result)
 
 
 def get_palette_colors(cmap_name=None, n_class=None, hashtag=False):
@@ -4354,17 +5239,69 @@ def get_palette_colors(cmap_name=None, n_class=None, hashtag=False):
     Returns:
         list: A list of hex colors.
     """
-    import matplotlib as mpl
+    if cmap_name is None or isinstance(cmap_name, str):
+        return list(_palette_colors_cached(cmap_name, n_class, hashtag))
+    return list(_palette_colors_cached.__wrapped__(cmap_name, n_class, hashtag))
+
+
+@functools.lru_cache(maxsize=256)
+def _palette_colors_cached(cmap_name=None, n_class=None, hashtag=False):
+    """Computes the hex colors of a matplotlib colormap, reusing them for repeated arguments.
+
+    Args:
+        cmap_name (str | matplotlib.colors.Colormap, optional): The colormap. Defaults to None.
+        n_class (int, optional): The number of colors. Defaults to None.
+        hashtag (bool, optional): Whether to prefix the hex colors with #. Defaults to False.
+
+    Returns:
+        tuple: The hex colors.
+    """
     import matplotlib.pyplot as plt
 
     try:
         cmap = plt.get_cmap(cmap_name, n_class)
     except:
         cmap = plt.cm.get_cmap(cmap_name, n_class)
-    colors = [mpl.colors.rgb2hex(cmap(i))[1:] for i in range(cmap.N)]
-    if hashtag:
-        colors = ["#" + i for i in colors]
-    return colors
+    # Convert all entries at once, rounding like matplotlib.colors.rgb2hex.
+    rgb = np.round(cmap(np.arange(cmap.N))[:, :3] * 255).astype(int)
+    prefix = "#" if hashtag else ""
+    return tuple(f"{prefix}{r:02x}{g:02x}{b:02x}" for r, g, b in rgb.tolist())
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_titiler_json(endpoint, params):
+    """Fetches a JSON response from a TiTiler endpoint, reusing it for repeated requests.
+
+    Args:
+        endpoint (str): The full URL of the TiTiler endpoint.
+        params (tuple): Sorted (key, value) pairs of query parameters.
+
+    Returns:
+        dict: The JSON response.
+    """
+    response = _SESSION.get(endpoint, params=dict(params))
+    response.raise_for_status()
+    return response.json()
+
+
+def _titiler_json(endpoint, params):
+    """Fetches a JSON response from a TiTiler endpoint, using the cache when possible.
+
+    Args:
+        endpoint (str): The full URL of the TiTiler endpoint.
+        params (dict): The query parameters.
+
+    Returns:
+        dict: A copy of the JSON response that callers may modify.
+    """
+    try:
+        result = _cached_titiler_json(endpoint, tuple(sorted(params.items())))
+    except TypeError:
+        # Unhashable parameters, e.g., lists of band indexes, cannot be cached.
+        response = _SESSION.get(endpoint, params=params)
+        response.raise_for_status()
+        return response.json()
+    return copy.deepcopy(result)
 
 
 def mosaic_tile(url, titiler_endpoint=None, **kwargs):
@@ -4386,10 +5323,7 @@ def mosaic_tile(url, titiler_endpoint=None, **kwargs):
         raise ValueError("url must be a string and start with http.")
 
     if isinstance(titiler_endpoint, str):
-        r = requests.get(
-            f"{titiler_endpoint}/mosaicjson/tilejson.json",
-            params=kwargs,
-        ).json()
+        r = _titiler_json(f"{titiler_endpoint}/mosaicjson/tilejson.json", kwargs)
     else:
         raise ValueError("titiler_endpoint must be a string.")
 
@@ -4415,10 +5349,7 @@ def mosaic_bounds(url, titiler_endpoint=None, **kwargs):
         raise ValueError("url must be a string and start with http.")
 
     if isinstance(titiler_endpoint, str):
-        r = requests.get(
-            f"{titiler_endpoint}/mosaicjson/bounds",
-            params=kwargs,
-        ).json()
+        r = _titiler_json(f"{titiler_endpoint}/mosaicjson/bounds", kwargs)
     else:
         raise ValueError("titiler_endpoint must be a string.")
 
@@ -4444,10 +5375,7 @@ def mosaic_info(url, titiler_endpoint=None, **kwargs):
         raise ValueError("url must be a string and start with http.")
 
     if isinstance(titiler_endpoint, str):
-        r = requests.get(
-            f"{titiler_endpoint}/mosaicjson/info",
-            params=kwargs,
-        ).json()
+        r = _titiler_json(f"{titiler_endpoint}/mosaicjson/info", kwargs)
     else:
         raise ValueError("titiler_endpoint must be a string.")
 
@@ -4473,10 +5401,7 @@ def mosaic_info_geojson(url, titiler_endpoint=None, **kwargs):
         raise ValueError("url must be a string and start with http.")
 
     if isinstance(titiler_endpoint, str):
-        r = requests.get(
-            f"{titiler_endpoint}/mosaicjson/info.geojson",
-            params=kwargs,
-        ).json()
+        r = _titiler_json(f"{titiler_endpoint}/mosaicjson/info.geojson", kwargs)
     else:
         raise ValueError("titiler_endpoint must be a string.")
 
@@ -5631,7 +6556,7 @@ def get_direct_url(url):
     if not url.startswith("http"):
         raise ValueError("url must start with http.")
 
-    r = requests.head(url, allow_redirects=True)
+    r = _SESSION.head(url, allow_redirects=True)
     return r.url
 
 
@@ -5692,7 +6617,7 @@ class The_national_map_USGS:
         """
         link = f"{self.api_endpoint}datasets?"
         try:
-            return requests.get(link).json()
+            return _SESSION.get(link).json()
         except Exception:
             print(f"Failed to load metadata from The National Map API endpoint\n{link}")
             return []
@@ -5895,7 +6820,7 @@ class The_national_map_USGS:
                 max += 2
 
             # Fetch response
-            response = requests.get(f"{self.api_endpoint}products?", params=used_locals)
+            response = _SESSION.get(f"{self.api_endpoint}products?", params=used_locals)
             if response.status_code // 100 == 2:
                 return response.json()
             else:
@@ -9857,15 +10782,12 @@ def image_comparison(
     """
 
     from PIL import Image
-    import base64
     import io
     import os
     import uuid
     from typing import Union
-    import requests
     import tempfile
     import numpy as np
-    from IPython.display import HTML, display
 
     TEMP_DIR = os.path.join(tempfile.gettempdir(), random_string(6))
     os.makedirs(TEMP_DIR, exist_ok=True)
@@ -9912,7 +10834,7 @@ def image_comparison(
             # read image if str image path is provided
             try:
                 image_pil = Image.open(
-                    requests.get(image, stream=True).raw
+                    _SESSION.get(image, stream=True).raw
                     if str(image).startswith("http")
                     else image
                 ).convert("RGB")
@@ -10264,7 +11186,6 @@ def coords_to_vector(coords, output=None, crs="EPSG:4326", **kwargs):
         gpd.GeoDataFraem: A GeoDataFrame of the coordinates.
     """
     import geopandas as gpd
-    from shapely.geometry import Point
 
     if not isinstance(coords, (list, tuple)):
         raise TypeError("coords must be a list of coordinates")
@@ -10273,7 +11194,7 @@ def coords_to_vector(coords, output=None, crs="EPSG:4326", **kwargs):
         coords = [(coords[0], coords[1])]
 
     # convert the points to a GeoDataFrame
-    geometry = [Point(xy) for xy in coords]
+    geometry = gpd.points_from_xy(*np.asarray(coords, dtype="float64").T)
     gdf = gpd.GeoDataFrame(geometry=geometry, crs="EPSG:4326")
     gdf.to_crs(crs, inplace=True)
 
@@ -10293,7 +11214,6 @@ def check_html_string(html_string):
         str: The HTML string with local images converted to base64.
     """
     import re
-    import base64
 
     # Search for img tags with src attribute
     img_regex = r'<img[^>]+src\s*=\s*["\']([^"\':]+)["\'][^>]*>'
@@ -10643,7 +11563,6 @@ def install_package(package):
     Args:
         package (str | list): The package name or a GitHub URL or a list of package names or GitHub URLs.
     """
-    import subprocess
 
     if isinstance(package, str):
         packages = [package]
@@ -11123,7 +12042,7 @@ def get_solar_data(
         "key": api_key,
     }
 
-    solar_data = requests.get(url, params=params, headers=header).json()
+    solar_data = _SESSION.get(url, params=params, headers=header).json()
 
     links = {}
 
@@ -11332,7 +12251,6 @@ def download_google_buildings(
 
     import pandas as pd
     import geopandas as gpd
-    from shapely import wkt
 
     building_url = "https://sites.research.google/open-buildings/tiles.geojson"
     country_url = (
@@ -11373,7 +12291,7 @@ def download_google_buildings(
             df = pd.read_csv(filename)
 
             # Create a geometry column from the "geometry" column in the DataFrame
-            df["geometry"] = df["geometry"].apply(wkt.loads)
+            df["geometry"] = gpd.GeoSeries.from_wkt(df["geometry"]).values
 
             # Convert the pandas DataFrame to a GeoDataFrame
             gdf = gpd.GeoDataFrame(df, geometry="geometry")
@@ -11416,12 +12334,11 @@ def google_buildings_csv_to_vector(
     """
     import pandas as pd
     import geopandas as gpd
-    from shapely import wkt
 
     df = pd.read_csv(filename)
 
     # Create a geometry column from the "geometry" column in the DataFrame
-    df["geometry"] = df["geometry"].apply(wkt.loads)
+    df["geometry"] = gpd.GeoSeries.from_wkt(df["geometry"]).values
 
     # Convert the pandas DataFrame to a GeoDataFrame
     gdf = gpd.GeoDataFrame(df, geometry="geometry")
@@ -11657,7 +12574,6 @@ def vector_to_mbtiles(
         max_zoom = 5
         vector_to_mbtiles(source_path, target_path, name=name, max_zoom=max_zoom)
     """
-    import subprocess
 
     command = [
         "ogr2ogr",
@@ -11705,7 +12621,6 @@ def geojson_to_mbtiles(
         subprocess.CalledProcessError: If there's an error executing the tippecanoe command.
     """
 
-    import subprocess
     import shutil
 
     # Check if tippecanoe exists
@@ -11789,7 +12704,6 @@ def vector_to_pmtiles(
     """
     if not target_path.endswith(".pmtiles"):
         raise ValueError("Error: target file must be a .pmtiles file.")
-    import subprocess
 
     command = [
         "ogr2ogr",
@@ -11843,7 +12757,6 @@ def geojson_to_pmtiles(
         subprocess.CalledProcessError: If there's an error executing the tippecanoe command.
     """
 
-    import subprocess
     import shutil
 
     # Check if tippecanoe exists
@@ -11927,7 +12840,6 @@ def pmtiles_header(input_file: str):
         of the file to retrieve the header.
     """
 
-    import requests
     from urllib.parse import urlparse
 
     try:
@@ -11944,7 +12856,7 @@ def pmtiles_header(input_file: str):
     if input_file.startswith("http"):
         # Fetch only the first 127 bytes
         headers = {"Range": "bytes=0-127"}
-        response = requests.get(input_file, headers=headers)
+        response = _SESSION.get(input_file, headers=headers)
         header = deserialize_header(response.content)
 
     else:
@@ -11995,7 +12907,6 @@ def pmtiles_metadata(input_file: str) -> Dict[str, Union[str, int, List[str]]]:
     """
 
     import json
-    import requests
     from urllib.parse import urlparse
 
     try:
@@ -12016,7 +12927,7 @@ def pmtiles_metadata(input_file: str) -> Dict[str, Union[str, int, List[str]]]:
 
     if input_file.startswith("http"):
         headers = {"Range": f"bytes=0-{metadata_offset + metadata_length}"}
-        response = requests.get(input_file, headers=headers)
+        response = _SESSION.get(input_file, headers=headers)
         content = MemorySource(response.content)
         metadata = Reader(content).metadata()
     else:
@@ -13285,10 +14196,9 @@ def df_to_gdf(df, geometry="geometry", src_crs="EPSG:4326", dst_crs=None, **kwar
         geopandas.GeoDataFrame: The converted GeoPandas GeoDataFrame.
     """
     import geopandas as gpd
-    from shapely import wkt
 
     # Convert the geometry column to Shapely geometry objects
-    df[geometry] = df[geometry].apply(lambda x: wkt.loads(x))
+    df[geometry] = gpd.GeoSeries.from_wkt(df[geometry]).values
 
     # Convert the pandas DataFrame to a GeoPandas GeoDataFrame
     gdf = gpd.GeoDataFrame(df, geometry=geometry, crs=src_crs, **kwargs)
@@ -13308,7 +14218,7 @@ def check_url(url: str) -> bool:
         bool: True if the URL is working (returns a 200 status code), False otherwise.
     """
     try:
-        response = requests.get(url)
+        response = _SESSION.get(url)
         if response.status_code == 200:
             return True
         else:
@@ -13552,7 +14462,6 @@ def gedi_search(
 
     """
 
-    import requests
     import datetime as dt
     import pandas as pd
     import geopandas as gpd
@@ -13568,7 +14477,7 @@ def gedi_search(
     doisearch = cmrurl + "collections.json?doi=" + doi
 
     # Send a request to the CMR API to get the concept ID
-    response = requests.get(doisearch)
+    response = _SESSION.get(doisearch)
     response.raise_for_status()
     concept_id = response.json()["feed"]["entry"][0]["id"]
 
@@ -13617,7 +14526,7 @@ def gedi_search(
 
         if isinstance(roi, list) or isinstance(roi, tuple):
             cmr_param["bounding_box[]"] = bound_str
-            response = requests.get(granulesearch, params=cmr_param)
+            response = _SESSION.get(granulesearch, params=cmr_param)
             response.raise_for_status()
         else:
             cmr_param["simplify-shapefile"] = "true"
@@ -13628,7 +14537,7 @@ def gedi_search(
                     "application/geo+json",
                 )
             }
-            response = requests.post(granulesearch, data=cmr_param, files=geojson)
+            response = _SESSION.post(granulesearch, data=cmr_param, files=geojson)
 
         # Send a request to the CMR API to get the granules
         granules = response.json()["feed"]["entry"]
@@ -14849,7 +15758,7 @@ def github_get_release_id_by_tag(username, repository, tag_name, access_token=No
     headers = {"Authorization": f"token {access_token}"} if access_token else {}
 
     # Make the request to the GitHub API
-    response = requests.get(url, headers=headers)
+    response = _SESSION.get(url, headers=headers)
 
     # Check if the request was successful
     if response.status_code == 200:
@@ -14883,7 +15792,7 @@ def github_get_release_assets(username, repository, release_id, access_token=Non
         "Accept": "application/vnd.github.v3+json",
     }
 
-    response = requests.get(url, headers=headers)
+    response = _SESSION.get(url, headers=headers)
 
     if response.status_code == 200:
         return response.json()
@@ -14964,7 +15873,7 @@ def github_upload_asset_to_release(
     # Open the asset file in binary mode
     with open(asset_path, "rb") as asset_file:
         # Make the request to upload the asset
-        response = requests.post(url, headers=headers, params=params, data=asset_file)
+        response = _SESSION.post(url, headers=headers, params=params, data=asset_file)
 
     # Check if the request was successful
     if response.status_code == 201:
@@ -15159,7 +16068,7 @@ def convert_to_gdf(
         ValueError: If the file format is unsupported or required columns are not provided.
     """
     import geopandas as gpd
-    from shapely.geometry import Point, shape
+    from shapely.geometry import shape
 
     if open_args is None:
         open_args = {}
@@ -15215,7 +16124,7 @@ def convert_to_gdf(
         data[geometry] = data[geometry].apply(convert_geometry)
     elif lat and lon:
         # Create a geometry column from latitude and longitude
-        data["geometry"] = data.apply(lambda row: Point(row[lon], row[lat]), axis=1)
+        data["geometry"] = gpd.points_from_xy(data[lon], data[lat])
         geometry = "geometry"
     else:
         raise ValueError(
@@ -15637,7 +16546,7 @@ def get_nwi(
         params[key] = value
 
     # Make the GET request
-    response = requests.get(url, params=params)
+    response = _SESSION.get(url, params=params)
 
     # Check if the request was successful
     if response.status_code == 200:
@@ -15805,7 +16714,7 @@ def get_wbd(
         params[key] = value
 
     # Make the GET request
-    response = requests.get(url, params=params)
+    response = _SESSION.get(url, params=params)
 
     if response.status_code != 200:
         return {"error": f"Request failed with status code {response.status_code}"}
@@ -15935,7 +16844,7 @@ def read_geojson(data: str, **kwargs: Any) -> Dict[str, Any]:
         Dict[str, Any]: The parsed GeoJSON data.
     """
 
-    return requests.get(data, **kwargs).json()
+    return _SESSION.get(data, **kwargs).json()
 
 
 def get_max_pixel_coords(
@@ -16157,7 +17066,6 @@ def line_to_points(data: str) -> "GeoDataFrame":
         GeoDataFrame: A new GeoDataFrame where each vertex of the LineString is a Point geometry.
     """
     import geopandas as gpd
-    from shapely.geometry import Point, LineString
     from geopandas import GeoDataFrame
 
     if isinstance(data, str):
@@ -16175,7 +17083,7 @@ def line_to_points(data: str) -> "GeoDataFrame":
     line = line_gdf.geometry.iloc[0]
 
     # Convert each point in the LineString to a Point geometry
-    points = [Point(coord) for coord in line.coords]
+    points = gpd.points_from_xy(*np.asarray(line.coords).T)
 
     # Create a new GeoDataFrame with these points
     points_gdf = gpd.GeoDataFrame(geometry=points, crs=line_gdf.crs)
@@ -16395,7 +17303,7 @@ def search_mapillary_images(
     url_imagesearch = f"{metadata_endpoint}/images?fields=id&bbox={bbox}&limit={limit}"
 
     try:
-        response = requests.get(url_imagesearch, headers=headers)
+        response = _SESSION.get(url_imagesearch, headers=headers)
         response.raise_for_status()  # Raise an HTTPError for bad responses
         return [image["id"] for image in response.json()["data"]]
     except requests.exceptions.RequestException as e:
@@ -16481,7 +17389,7 @@ def get_mapillary_image_url(
     params = {"fields": fields, "access_token": access_token}
 
     # Fetch the data
-    response = requests.get(url, params=params, **kwargs)
+    response = _SESSION.get(url, params=params, **kwargs)
 
     # Check the response
     if response.status_code == 200:
@@ -16916,7 +17824,7 @@ def get_overture_latest_release(patch=False) -> str:
     url = "https://labs.overturemaps.org/data/releases.json"
 
     try:
-        response = requests.get(url)
+        response = _SESSION.get(url)
         response.raise_for_status()  # Raise an exception for HTTP errors
 
         data = response.json()
@@ -17345,7 +18253,7 @@ def get_ee_tile_url(
 
     payload = {"asset_id": asset_id, "vis_params": vis_params}
     try:
-        response = requests.post(endpoint, json=payload)
+        response = _SESSION.post(endpoint, json=payload)
         response.raise_for_status()
         return response.json()["tile_url"]
     except requests.RequestException as e:
@@ -17428,7 +18336,7 @@ class GoogleMapsTileProvider(xyzservices.TileProvider):
             raise ValueError(f"map_type must be one of: {self.MAP_TYPE_CONFIG.keys()}")
 
         request_url = f"https://tile.googleapis.com/v1/createSession?key={key}"
-        response = requests.post(
+        response = _SESSION.post(
             url=request_url,
             headers={"Content-Type": "application/json"},
             json={
@@ -17581,7 +18489,7 @@ def get_nwi_year(
         "outFields": fields,
         "returnGeometry": return_geometry,
     }
-    r = requests.get(url, params=params)
+    r = _SESSION.get(url, params=params)
     if r.status_code == 200:
         gdf = gpd.GeoDataFrame.from_features(r.json())
         gdf.crs = f"EPSG:{epsg}"
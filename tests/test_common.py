@@ -2,7 +2,9 @@
 
 """Tests for `leafmap` package."""
 
+import json
 import os
+import tempfile
 import unittest
 import geopandas
 import pandas
@@ -43,6 +45,18 @@ class TestCommon(unittest.TestCase):
     def test_gdf_to_geojson(self):
         self.assertIsInstance(gdf_to_geojson(csv_to_gdf(self.in_csv)), dict)
 
+    def test_points_from_xy_keeps_date_columns(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            in_csv = os.path.join(tmp_dir, "gps.csv")
+            with open(in_csv, "w") as f:
+                f.write("latitude,longitude,timestamp,day\n")
+                f.write("40.1,-105.2,2024-05-01T10:00:00,2024-05-01\n")
+                f.write("40.2,-105.3,2024-05-01T10:01:00,2024-05-01\n")
+            gdf = points_from_xy(in_csv)
+        data = json.loads(gdf.to_json())
+        self.assertEqual(len(data["features"]), 2)
+        self.assertEqual(data["features"][0]["properties"]["day"], "2024-05-01")
+
     def test_kml_to_geojson(self):
         self.assertIsInstance(kml_to_geojson(self.in_kml), dict)
 
@@ -55,6 +69,30 @@ class TestCommon(unittest.TestCase):
     def test_vector_to_geojson(self):
         self.assertIsInstance(vector_to_geojson(self.in_shp), dict)
 
+    def test_vector_to_geojson_chunked(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_geojson = os.path.join(tmp_dir, "countries.geojson")
+            vector_to_geojson(self.in_shp, out_geojson, chunk_size=50)
+            gdf = geopandas.read_file(out_geojson)
+        expected = shp_to_gdf(self.in_shp)
+        self.assertEqual(len(gdf), len(expected))
+        self.assertEqual(list(gdf["NAME"]), list(expected["NAME"]))
+
+    def test_vector_col_names(self):
+        col_names = vector_col_names(self.in_shp)
+        self.assertIn("NAME", col_names)
+        self.assertEqual(col_names[-1], "geometry")
+
+    def test_gdf_bounds(self):
+        gdf = shp_to_gdf(self.in_shp)
+        self.assertEqual(list(gdf_bounds(gdf)), list(gdf.total_bounds))
+
+    def test_gdf_bounds_empty(self):
+        gdf = shp_to_gdf(self.in_shp).iloc[:0]
+        bounds = gdf_bounds(gdf)
+        self.assertEqual(len(bounds), 4)
+        self.assertTrue(all(pandas.isna(bounds)))
+
     def test_cog_bounds(self):
         self.assertIsInstance(cog_bounds(self.in_cog), list)
         self.assertEqual(len(cog_bounds(self.in_cog)), 4)
@@ -63,6 +101,50 @@ class TestCommon(unittest.TestCase):
         self.assertIsInstance(cog_center(self.in_cog), tuple)
         self.assertEqual(len(cog_center(self.in_cog)), 2)
 
+    def test_get_bounds(self):
+        polygon = {
+            "type": "Polygon",
+            "coordinates": [
+                [[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]],
+                [[1, 1], [2, 1], [2, 2], [1, 1]],
+            ],
+        }
+        self.assertEqual(get_bounds(polygon), (0, 0, 4, 4))
+        self.assertEqual(get_bounds(polygon, north_up=False), (0, 4, 4, 0))
+        line = {"type": "LineString", "coordinates": [[0, 0, 100], [5, -3, 200]]}
+        fc = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [-50, 3]},
+                },
+                {"type": "Feature", "geometry": line},
+            ],
+        }
+        self.assertEqual(get_bounds(fc), (-50, -3, 5, 3))
+        self.assertNotIn("bbox", fc)
+        self.assertEqual(get_bounds(fc, cache=True), (-50, -3, 5, 3))
+        self.assertEqual(fc["bbox"], [-50, -3, 5, 3])
+        self.assertEqual(get_bounds(fc, north_up=False), (-50, 3, 5, -3))
+
+    def test_rgb_to_hex(self):
+        self.assertEqual(rgb_to_hex((255, 128, 0)), "ff8000")
+        self.assertEqual(rgb_to_hex((0, 0, 0)), "000000")
+        self.assertEqual(rgb_to_hex(hex_to_rgb("#1a2b3c")), "1a2b3c")
+
+    def test_hex_to_rgb(self):
+        self.assertEqual(hex_to_rgb("#ff8000"), (255, 128, 0))
+        self.assertEqual(hex_to_rgb("FFFFFF"), (255, 255, 255))
+        self.assertEqual(hex_to_rgb("f80"), (255, 136, 0))
+
+    def test_check_color(self):
+        self.assertEqual(check_color("red"), "#ff0000")
+        self.assertEqual(check_color("ff0"), "#ffff00")
+        self.assertEqual(check_color([255, 0, 0]), "#ff0000")
+        self.assertEqual(check_color((1, 1, 1)), "#010101")
+        self.assertEqual(check_color((1.0, 1.0, 1.0)), "#ffffff")
+
     @patch("os.environ", {})
     @patch("requests.get")
     def test_set_proxy_successful_request(self, mock_get):